@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 
 from .base import ChangeAgent
 from .cursor_agent import CursorChangeAgent
@@ -9,11 +10,16 @@ from pr_creator.cursor_utils.runners import get_cursor_runner
 DEFAULT_AGENT = "cursor"
 
 
-def get_change_agent(name: str | None = None) -> ChangeAgent:
-    agent_name = (name or os.environ.get("CHANGE_AGENT") or DEFAULT_AGENT).lower()
+@lru_cache(maxsize=None)
+def _get_change_agent_cached(agent_name: str) -> ChangeAgent:
     if agent_name == "cursor":
         return CursorChangeAgent(get_cursor_runner())
     raise ValueError(f"Unknown change agent: {agent_name}")
 
 
+def get_change_agent(name: str | None = None) -> ChangeAgent:
+    agent_name = (name or os.environ.get("CHANGE_AGENT") or DEFAULT_AGENT).lower()
+    return _get_change_agent_cached(agent_name)
+
+
 __all__ = ["ChangeAgent", "CursorChangeAgent", "get_change_agent"]
@@ -4,6 +4,7 @@ from pathlib import Path
 
 from .base import ChangeAgent
 from pr_creator.cursor_utils.runners import CursorRunner, get_cursor_runner
+from pr_creator.workspace_mounts import resolve_host_path
 
 
 class CursorChangeAgent(ChangeAgent):
@@ -18,7 +19,7 @@ class CursorChangeAgent(ChangeAgent):
         context_roots: list[str],
         secrets: dict[str, str] | None = None,
     ) -> None:
-        repo_abs = str(repo_path.resolve())
+        repo_abs = resolve_host_path(str(repo_path))
         self._runner.run_prompt(
             prompt,
             remove=False,
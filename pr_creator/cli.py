@@ -1,11 +1,11 @@
 import argparse
 import asyncio
 import json
+from collections import deque
 from pathlib import Path
 
 from .logging_config import configure_logging
 from .state import WorkflowState
-from .workflow import run_workflow
 from pr_creator.context_roots import normalize_context_roots
 
 
@@ -113,15 +113,20 @@ def main() -> None:
         jira_base_url=args.jira_base_url,
         jira_email=args.jira_email,
         jira_api_token=args.jira_api_token,
-        repos=list(args.repo or []),
-        working_dir=Path(args.working_dir),
+        repos=deque(args.repo or []),
+        working_dir=Path(args.working_dir).resolve(),
         context_roots=context_roots,
         change_agent_secret_kv_pairs=list(args.secret or []),
         change_agent_secret_env_keys=list(args.secret_env or []),
         datadog_team=args.datadog_team,
-        datadog_site=args.datadog_site.replace("https://", "").replace("api.", ""),
+        # Normalized to a bare host by the Datadog discovery client.
+        datadog_site=args.datadog_site,
         change_id=args.change_id,
     )
+    # Imported here so `--help` and argument errors don't pay for loading the
+    # workflow steps (agents, docker, GitHub clients).
+    from .workflow import run_workflow
+
     try:
         final_state = asyncio.run(run_workflow(state))
     except ValueError as e:
@@ -1,26 +1,24 @@
 from __future__ import annotations
 
 import os
-from pathlib import Path
+from functools import lru_cache
 
+from pr_creator.workspace_mounts import resolve_host_path
 
 AGENT_CONTEXT_ROOTS_ENV = "AGENT_CONTEXT_ROOTS"
 
 
-def normalize_context_roots(roots: list[str]) -> list[str]:
-    parts = [str(p).strip() for p in roots if str(p).strip()]
+def _normalize_one(p: str) -> str:
+    try:
+        return resolve_host_path(p)
+    except Exception:
+        return p
+
 
-    normalized: list[str] = []
-    seen: set[str] = set()
-    for p in parts:
-        try:
-            abs_p = str(Path(p).expanduser().resolve())
-        except Exception:
-            abs_p = p
-        if abs_p not in seen:
-            normalized.append(abs_p)
-            seen.add(abs_p)
-    return normalized
+def normalize_context_roots(roots: list[str]) -> list[str]:
+    parts = (str(p).strip() for p in roots)
+    # dict.fromkeys dedupes while keeping first-seen order (mount indices).
+    return list(dict.fromkeys(_normalize_one(p) for p in parts if p))
 
 
 def merge_context_roots(*root_lists: list[str]) -> list[str]:
@@ -35,14 +33,18 @@ def merge_context_roots(*root_lists: list[str]) -> list[str]:
     return normalize_context_roots(combined)
 
 
-def get_context_roots_from_env() -> list[str]:
+@lru_cache(maxsize=1)
+def get_context_roots_from_env() -> tuple[str, ...]:
     """
     Host directories to expose to agents as read-only context.
 
     Preferred env var:
       - AGENT_CONTEXT_ROOTS="/abs/path/one,/abs/path/two"
+
+    Parsed once per process; call `get_context_roots_from_env.cache_clear()` after
+    changing the env (e.g. in tests).
     """
     raw = os.environ.get(AGENT_CONTEXT_ROOTS_ENV, "").strip()
 
     parts = [p.strip() for p in raw.split(",") if p.strip()]
-    return normalize_context_roots(parts)
+    return tuple(normalize_context_roots(parts))
@@ -1,27 +1,31 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from typing import Dict
 
 
+# Env vars don't change during a run, so parse them once per process.
+@lru_cache(maxsize=1)
 def get_cursor_image() -> str:
     """Get the Cursor Docker image from environment, with default."""
     return os.environ.get("CURSOR_IMAGE", "leonpatmore2/cursor-agent:latest")
 
 
+@lru_cache(maxsize=1)
 def get_cursor_model() -> str:
     """Get the Cursor model from environment, with default."""
     return os.environ.get("CURSOR_MODEL", "gpt-5.2")
 
 
-def get_cursor_env_vars() -> Dict[str, str]:
-    """Collect environment variables for Cursor agent."""
+@lru_cache(maxsize=1)
+def _cursor_env_vars() -> tuple[tuple[str, str], ...]:
     env_keys_str = os.environ.get("CURSOR_ENV_KEYS", "CURSOR_API_KEY")
-    env_keys = [k.strip() for k in env_keys_str.split(",") if k.strip()]
+    keys = (k.strip() for k in env_keys_str.split(","))
+    return tuple((k, os.environ[k]) for k in keys if k and k in os.environ)
 
-    env_vars: Dict[str, str] = {}
-    for key in env_keys:
-        if key in os.environ:
-            env_vars[key] = os.environ[key]
 
-    return env_vars
+def get_cursor_env_vars() -> Dict[str, str]:
+    """Collect environment variables for Cursor agent."""
+    # Fresh dict per call so callers can't mutate the cached values.
+    return dict(_cursor_env_vars())
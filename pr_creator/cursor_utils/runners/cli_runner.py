@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-import json
 import os
 import subprocess
-import sys
 from subprocess import PIPE, STDOUT
 
-from pr_creator.cursor_utils.config import get_cursor_env_vars, get_cursor_model
+from pr_creator.cursor_utils.config import get_cursor_model
 from pr_creator.cursor_utils.runners.base import CursorHintPaths
+from pr_creator.cursor_utils.streaming import READ_CHUNK_SIZE, stream_cursor_output
 from pr_creator.workspace_mounts import workspace_prompt_prefix
 
 
@@ -42,98 +41,31 @@ def _run_streaming_process(
         env=env,
         stdout=PIPE,
         stderr=STDOUT,
-        text=True,
-        bufsize=1,
+        bufsize=0,
     )
     assert proc.stdout is not None  # for type checkers
-    raw_chunks: list[str] = []
-    text_chunks: list[str] = []
-    stream_mode = (env.get("CURSOR_STREAM_MODE") or "assistant").lower().strip()
-    show_thinking = (env.get("CURSOR_STREAM_SHOW_THINKING") or "").strip().lower() in (
-        "1",
-        "true",
-        "yes",
-        "y",
-    )
-
-    def emit(text: str) -> None:
-        text_chunks.append(text)
-        sys.stdout.write(text)
-        sys.stdout.flush()
-
-    def emit_raw(line: str) -> None:
-        raw_chunks.append(line)
-        sys.stdout.write(line)
-        sys.stdout.flush()
-
-    def extract_text(event: dict) -> tuple[str | None, str | None]:
-        """
-        Return (kind, text) where kind is one of:
-        - "thinking"
-        - "assistant"
-        - "other"
-        """
-        if "type" in event and isinstance(event["type"], str):
-            kind = event["type"]
-        else:
-            kind = "other"
-
-        # Common shape we see: {"type":"thinking","subtype":"delta","text":"..."}
-        if "text" in event and isinstance(event["text"], str):
-            return kind, event["text"]
-
-        # OpenAI-ish shape: {"type":"assistant","message":{"role":"assistant","content":[{"type":"text","text":"..."}]}}
-        msg = event.get("message")
-        if isinstance(msg, dict):
-            content = msg.get("content")
-            if isinstance(content, list):
-                parts: list[str] = []
-                for item in content:
-                    if isinstance(item, dict) and isinstance(item.get("text"), str):
-                        parts.append(item["text"])
-                if parts:
-                    return "assistant", "".join(parts)
-
-        return kind, None
-
-    for line in proc.stdout:
-        if stream_mode == "raw":
-            emit_raw(line)
-            continue
-
-        # Best-effort: parse stream-json and print a human-friendly subset.
-        stripped = line.strip()
-        if not stripped:
-            continue
-        try:
-            event = json.loads(stripped)
-        except Exception:
-            # Not JSON: print as-is.
-            emit_raw(line)
-            continue
-
-        if not isinstance(event, dict):
-            emit_raw(line)
-            continue
-
-        kind, text = extract_text(event)
-        if kind == "thinking" and not show_thinking:
-            continue
-
-        if stream_mode == "assistant":
-            # Only show assistant-ish text (and optionally thinking).
-            if kind not in ("assistant", "thinking"):
-                continue
-
-        if text:
-            emit(text)
+    stdout = proc.stdout
+    chunks = iter(lambda: stdout.read(READ_CHUNK_SIZE), b"")
+    output = stream_cursor_output(chunks, env=env)
     rc = proc.wait()
-    output = "".join(text_chunks) if stream_mode != "raw" else "".join(raw_chunks)
     if rc != 0:
         raise subprocess.CalledProcessError(rc, command, output=output)
     return output
 
 
+def _default_workspace_root(repo_abs: str | None, context_roots: list[str]) -> str:
+    # Common case: no context roots, or all of them inside the repo.
+    if repo_abs:
+        repo_prefix = repo_abs.rstrip(os.sep) + os.sep
+        if all(r == repo_abs or r.startswith(repo_prefix) for r in context_roots):
+            return repo_abs
+    paths = [p for p in [repo_abs, *context_roots] if p]
+    try:
+        return os.path.commonpath(paths) if paths else os.getcwd()
+    except Exception:
+        return repo_abs or os.getcwd()
+
+
 class CLICursorRunner:
     """
     Runs Cursor locally using the `cursor-agent` CLI on the host.
@@ -165,8 +97,9 @@ class CLICursorRunner:
         _ = remove
         model = get_cursor_model()
 
+        # The host process already inherits every CURSOR_ENV_KEYS var, so unlike the
+        # Docker runner there's nothing to collect; just layer the extras on top.
         env_vars = os.environ.copy()
-        env_vars.update(get_cursor_env_vars())
         if extra_env:
             env_vars.update(extra_env)
 
@@ -180,11 +113,7 @@ class CLICursorRunner:
 
         workspace_root = os.environ.get("CURSOR_WORKSPACE_ROOT")
         if not workspace_root:
-            paths = [p for p in [repo_abs, *context_roots] if p]
-            try:
-                workspace_root = os.path.commonpath(paths) if paths else os.getcwd()
-            except Exception:
-                workspace_root = repo_abs or os.getcwd()
+            workspace_root = _default_workspace_root(repo_abs, context_roots)
 
         command = _base_cursor_command(
             cli_bin=self._cli_bin,
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
-import docker
+import atexit
+import logging
+import os
+import socket
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 
 from pr_creator.cursor_utils.config import (
     get_cursor_env_vars,
@@ -10,32 +15,94 @@ from pr_creator.cursor_utils.config import (
     get_cursor_model,
 )
 from pr_creator.cursor_utils.runners.base import CursorHintPaths
+from pr_creator.cursor_utils.streaming import stream_cursor_output
 from pr_creator.workspace_mounts import (
     CONTEXT_DIR,
     REPO_DIR,
+    REPOS_DIR,
     WORKSPACE_ROOT,
+    resolve_host_path,
     workspace_prompt_prefix,
 )
 
+if TYPE_CHECKING:
+    import docker
+    from docker.models.containers import Container
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONTAINER_POOL_SIZE = 2
+
+# Label on pooled containers, valued "<hostname>:<pid>" of the owning process, so
+# containers left running by a crashed run can be found and reaped.
+POOL_LABEL = "pr-creator.cursor-pool"
+
+
+@lru_cache(maxsize=1)
+def _get_docker_client() -> docker.DockerClient:
+    """Shared Docker client; reuses one connection pool to the daemon."""
+    # Imported lazily so CURSOR_RUNNER=cli never loads the docker SDK.
+    import docker
+
+    return docker.from_env()
+
+
+_pulled_images: set[str] = set()
+_pull_lock = threading.Lock()
+
+
+def _ensure_image(client: docker.DockerClient, image: str) -> None:
+    """
+    Make sure `image` is available locally before the first container starts.
+
+    Serialized so concurrent repos don't each trigger their own pull of the same
+    image. Set CURSOR_SKIP_PREPULL=1 to leave pulling to `docker run` (e.g. offline).
+    """
+    if image in _pulled_images:
+        return
+    if (os.environ.get("CURSOR_SKIP_PREPULL") or "").strip().lower() in (
+        "1",
+        "true",
+        "yes",
+        "y",
+    ):
+        return
+    from docker.errors import ImageNotFound
+
+    with _pull_lock:
+        if image in _pulled_images:
+            return
+        try:
+            client.images.get(image)
+        except ImageNotFound:
+            logger.info("Pulling cursor-agent image %s", image)
+            client.images.pull(image)
+        _pulled_images.add(image)
+
 
 def _build_workspace_volumes(
-    repo_abs: str | None, *, context_roots: list[str]
+    repo_abs: str | None, *, context_roots: list[str], shared_repos: bool = False
 ) -> dict[str, dict[str, Any]]:
     """
     Build docker-py `volumes` mapping for an agent container.
 
     We mount the *target repo* at /workspace/repo (rw) and any extra context roots
-    at /workspace/context/<n> (ro).
+    at /workspace/context/<n> (ro). With `shared_repos`, the repo's parent directory
+    is mounted at /workspace/repos instead so one container can serve every repo
+    cloned under the same working dir.
     """
 
     volumes: dict[str, dict[str, Any]] = {}
 
     if repo_abs:
-        volumes[repo_abs] = {"bind": REPO_DIR, "mode": "rw"}
+        if shared_repos:
+            volumes[str(Path(repo_abs).parent)] = {"bind": REPOS_DIR, "mode": "rw"}
+        else:
+            volumes[repo_abs] = {"bind": REPO_DIR, "mode": "rw"}
 
     for idx, root in enumerate(context_roots):
         try:
-            root_abs = str(Path(root).expanduser().resolve())
+            root_abs = resolve_host_path(root)
         except Exception:
             root_abs = root
         volumes[root_abs] = {"bind": f"{CONTEXT_DIR}/{idx}", "mode": "ro"}
@@ -43,14 +110,232 @@ def _build_workspace_volumes(
     return volumes
 
 
+def _stream_chunks(chunks: Iterable[bytes]) -> bytes:
+    """
+    Echo container output as it arrives (same formatting as the CLI runner) and
+    return the raw bytes, like `containers.run` would.
+    """
+    raw: list[bytes] = []
+
+    def tee() -> Iterator[bytes]:
+        for chunk in chunks:
+            raw.append(chunk)
+            yield chunk
+
+    stream_cursor_output(tee(), env=os.environ)
+    return b"".join(raw)
+
+
+def _container_pool_size() -> int:
+    raw = (os.environ.get("CURSOR_CONTAINER_POOL_SIZE") or "").strip()
+    if not raw:
+        return DEFAULT_CONTAINER_POOL_SIZE
+    try:
+        return max(0, int(raw))
+    except Exception:
+        logger.warning(
+            "Invalid CURSOR_CONTAINER_POOL_SIZE=%r; defaulting to %s",
+            raw,
+            DEFAULT_CONTAINER_POOL_SIZE,
+        )
+        return DEFAULT_CONTAINER_POOL_SIZE
+
+
+def _shared_repos_mount_enabled() -> bool:
+    return (os.environ.get("CURSOR_CONTAINER_SHARED_REPOS") or "").strip().lower() in (
+        "1",
+        "true",
+        "yes",
+        "y",
+    )
+
+
+def _pool_key(
+    image: str, volumes: dict[str, dict[str, Any]]
+) -> tuple[str, tuple[tuple[str, str, str], ...]]:
+    mounts = tuple(
+        sorted((host, spec["bind"], spec["mode"]) for host, spec in volumes.items())
+    )
+    return image, mounts
+
+
+def _pool_owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _reap_stale_containers(client: docker.DockerClient) -> None:
+    """
+    Remove pooled containers still running for a process on this host that has
+    died (e.g. killed before its atexit hook ran).
+    """
+    hostname = socket.gethostname()
+    try:
+        running = client.containers.list(
+            filters={"label": POOL_LABEL, "status": "running"}
+        )
+    except Exception as exc:
+        logger.warning("[cursor-pool] failed to list stale containers: %s", exc)
+        return
+    for container in running:
+        host, _, pid = (container.labels.get(POOL_LABEL) or "").rpartition(":")
+        if host == hostname and pid.isdigit() and not _process_alive(int(pid)):
+            logger.info("[cursor-pool] reaping stale container %s", container.name)
+            _remove_container(container)
+
+
+class CursorContainerPool:
+    """
+    Long-lived `cursor-agent` containers kept alive with `sleep infinity`.
+
+    Bind mounts can't change after a container starts, so containers are keyed by
+    (image, mounts). Prompts are dispatched with `docker exec`, which skips the
+    container cold-start on every evaluate/apply/review pass for the same repo.
+    At most `max_idle` containers are kept warm; the least recently used are removed.
+
+    Every container started is tracked until it is retired, so `shutdown` also
+    cleans up containers still checked out at exit. Containers used by a run with
+    `remove=False` are stopped rather than removed, like an exited one-off run.
+    """
+
+    def __init__(self, *, max_idle: int) -> None:
+        self._max_idle = max_idle
+        # Idle containers, least recently used first.
+        self._idle: list[tuple[tuple, Container]] = []
+        # Every live container by id, idle or checked out.
+        self._live: dict[str, Container] = {}
+        # Ids of containers to stop instead of remove when retired.
+        self._keep: set[str] = set()
+        self._lock = threading.Lock()
+        self._started = 0
+
+    def acquire(
+        self,
+        client: docker.DockerClient,
+        image: str,
+        volumes: dict[str, dict[str, Any]],
+        *,
+        remove: bool = True,
+    ) -> tuple[tuple, Container]:
+        key = _pool_key(image, volumes)
+        with self._lock:
+            for idx in range(len(self._idle) - 1, -1, -1):
+                if self._idle[idx][0] == key:
+                    key, container = self._idle.pop(idx)
+                    if not remove:
+                        self._keep.add(container.id)
+                    return key, container
+            first = not self._started
+            if first:
+                atexit.register(self.shutdown)
+            self._started += 1
+            name = f"cursor-pool-{os.getpid()}-{self._started}"
+
+        if first:
+            _reap_stale_containers(client)
+        logger.info("[cursor-pool] starting container %s (image=%s)", name, image)
+        try:
+            container = client.containers.run(
+                image,
+                command=["sleep", "infinity"],
+                detach=True,
+                volumes=volumes or {},
+                working_dir=WORKSPACE_ROOT,
+                name=name,
+                labels={POOL_LABEL: _pool_owner()},
+            )
+        except BaseException:
+            # `run` creates before it starts; don't leave a half-started container.
+            try:
+                _remove_container(client.containers.get(name))
+            except Exception:
+                pass
+            raise
+        with self._lock:
+            self._live[container.id] = container
+            if not remove:
+                self._keep.add(container.id)
+        return key, container
+
+    def release(self, key: tuple, container: Container) -> None:
+        with self._lock:
+            if container.id not in self._live:
+                # Already retired by `shutdown` while it was checked out.
+                return
+            self._idle.append((key, container))
+            evicted = self._idle[: max(0, len(self._idle) - self._max_idle)]
+            del self._idle[: len(evicted)]
+        for _, stale in evicted:
+            self.discard(stale)
+
+    def discard(self, container: Container) -> None:
+        with self._lock:
+            self._live.pop(container.id, None)
+            keep = container.id in self._keep
+            self._keep.discard(container.id)
+        if keep:
+            _stop_container(container)
+        else:
+            _remove_container(container)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._idle = []
+            live = list(self._live.values())
+        for container in live:
+            self.discard(container)
+
+
+def _remove_container(container: Container) -> None:
+    try:
+        container.remove(force=True)
+    except Exception as exc:
+        logger.warning(
+            "[cursor-pool] failed to remove container %s: %s", container.name, exc
+        )
+
+
+def _stop_container(container: Container) -> None:
+    try:
+        # `sleep infinity` runs as PID 1 and ignores SIGTERM, so kill it outright.
+        container.kill()
+    except Exception as exc:
+        logger.warning(
+            "[cursor-pool] failed to stop container %s: %s", container.name, exc
+        )
+
+
 class DockerCursorRunner:
+    def __init__(self, *, pool_size: int | None = None) -> None:
+        size = _container_pool_size() if pool_size is None else pool_size
+        self._pool = CursorContainerPool(max_idle=size) if size > 0 else None
+        # Sharing the repos mount only pays off when containers are reused.
+        self._shared_repos = self._pool is not None and _shared_repos_mount_enabled()
+
+    def _container_repo_dir(self, repo_abs: str | None) -> str | None:
+        if not repo_abs:
+            return None
+        if self._shared_repos:
+            return f"{REPOS_DIR}/{Path(repo_abs).name}"
+        return REPO_DIR
+
     def hint_paths(
         self, *, repo_abs: str | None, context_roots: list[str]
     ) -> CursorHintPaths:
-        # Within the container, the repo is always mounted at /workspace/repo.
+        # Within the container, the repo is mounted at /workspace/repo, or under
+        # /workspace/repos when the parent dir is shared between repos.
         context_dirs = [f"{CONTEXT_DIR}/{idx}" for idx, _ in enumerate(context_roots)]
         return CursorHintPaths(
-            repo_dir=REPO_DIR if repo_abs else None, context_dirs=context_dirs
+            repo_dir=self._container_repo_dir(repo_abs), context_dirs=context_dirs
         )
 
     def run_prompt(
@@ -78,10 +363,13 @@ class DockerCursorRunner:
         if extra_env:
             env_vars = {**env_vars, **extra_env}
 
-        volumes = _build_workspace_volumes(repo_abs, context_roots=context_roots)
-        workdir = REPO_DIR if repo_abs else WORKSPACE_ROOT
+        volumes = _build_workspace_volumes(
+            repo_abs, context_roots=context_roots, shared_repos=self._shared_repos
+        )
+        workdir = hint.repo_dir or WORKSPACE_ROOT
 
-        client = docker.from_env()
+        client = _get_docker_client()
+        _ensure_image(client, image)
         command = [
             "cursor-agent",
             "--workspace",
@@ -96,16 +384,119 @@ class DockerCursorRunner:
             )
         command.extend(["--print", full_prompt])
 
-        output_bytes = client.containers.run(
+        if self._pool is not None:
+            # Pooled containers outlive the run; `remove` applies when they retire.
+            output_bytes = self._exec_in_pool(
+                client,
+                image,
+                command,
+                volumes=volumes,
+                workdir=workdir,
+                env_vars=env_vars,
+                stream=stream_partial_output,
+                remove=remove,
+            )
+        elif stream_partial_output:
+            output_bytes = self._run_streaming(
+                client,
+                image,
+                command,
+                volumes=volumes,
+                workdir=workdir,
+                env_vars=env_vars,
+                remove=remove,
+            )
+        else:
+            output_bytes = client.containers.run(
+                image,
+                command=command,
+                volumes=volumes or {},
+                working_dir=workdir,
+                environment=env_vars,
+                remove=remove,
+            )
+        return (
+            output_bytes.decode("utf-8")
+            if isinstance(output_bytes, bytes)
+            else str(output_bytes)
+        )
+
+    def _exec_in_pool(
+        self,
+        client: docker.DockerClient,
+        image: str,
+        command: list[str],
+        *,
+        volumes: dict[str, dict[str, Any]],
+        workdir: str,
+        env_vars: dict[str, str],
+        stream: bool,
+        remove: bool,
+    ) -> bytes:
+        assert self._pool is not None
+        key, container = self._pool.acquire(client, image, volumes, remove=remove)
+        try:
+            if stream:
+                # Low-level API so the exit code can be read after streaming.
+                exec_id = client.api.exec_create(
+                    container.id,
+                    command,
+                    stdout=True,
+                    stderr=False,
+                    environment=env_vars,
+                    workdir=workdir,
+                )["Id"]
+                output = _stream_chunks(client.api.exec_start(exec_id, stream=True))
+                exit_code = client.api.exec_inspect(exec_id)["ExitCode"]
+            else:
+                exit_code, output = container.exec_run(
+                    command,
+                    stdout=True,
+                    stderr=False,
+                    environment=env_vars,
+                    workdir=workdir,
+                )
+        except BaseException:
+            # Interrupted or failed mid-exec: the container may still be busy.
+            self._pool.discard(container)
+            raise
+        self._pool.release(key, container)
+        if exit_code != 0:
+            from docker.errors import ContainerError
+
+            # Mirror `containers.run`, which raises on a non-zero exit status.
+            raise ContainerError(container, exit_code, command, image, output)
+        return output
+
+    def _run_streaming(
+        self,
+        client: docker.DockerClient,
+        image: str,
+        command: list[str],
+        *,
+        volumes: dict[str, dict[str, Any]],
+        workdir: str,
+        env_vars: dict[str, str],
+        remove: bool,
+    ) -> bytes:
+        container = client.containers.run(
             image,
             command=command,
             volumes=volumes or {},
             working_dir=workdir,
             environment=env_vars,
-            remove=remove,
-        )
-        return (
-            output_bytes.decode("utf-8")
-            if isinstance(output_bytes, bytes)
-            else str(output_bytes)
+            detach=True,
         )
+        try:
+            output = _stream_chunks(
+                container.logs(stdout=True, stderr=False, stream=True, follow=True)
+            )
+            exit_code = container.wait().get("StatusCode", 0)
+        finally:
+            if remove:
+                _remove_container(container)
+        if exit_code != 0:
+            from docker.errors import ContainerError
+
+            raise ContainerError(container, exit_code, command, image, output)
+        return output
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import codecs
+import json
+import sys
+from typing import Iterable, Iterator, Mapping
+
+# Pipe read size for streamed agent output.
+READ_CHUNK_SIZE = 64 * 1024
+
+
+def iter_line_batches(chunks: Iterable[bytes]) -> Iterator[list[str]]:
+    """
+    Split a byte stream into decoded lines, yielding all complete lines per chunk.
+
+    A partial trailing line is carried over to the next chunk (and flushed at EOF).
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    for chunk in chunks:
+        pending += decoder.decode(chunk)
+        # Split on "\n" only, like iterating a text stream: str.splitlines() also
+        # breaks on U+2028, \x85 and friends, which JSON allows raw inside strings.
+        lines = pending.split("\n")
+        pending = lines.pop()
+        if lines:
+            yield [line + "\n" for line in lines]
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield [pending]
+
+
+_DECODER = json.JSONDecoder()
+
+# Event kinds shown in the default `assistant` stream mode.
+_ASSISTANT_KINDS = frozenset(("assistant", "thinking"))
+
+
+def _extract_text(event: dict) -> tuple[str, str | None]:
+    """
+    Return (kind, text) where kind is the event's `type` ("thinking", "assistant",
+    ...) or "other".
+    """
+    kind = event.get("type")
+    if not isinstance(kind, str):
+        kind = "other"
+
+    # Common shape we see: {"type":"thinking","subtype":"delta","text":"..."}
+    text = event.get("text")
+    if isinstance(text, str):
+        return kind, text
+
+    # OpenAI-ish shape: {"type":"assistant","message":{"role":"assistant","content":[{"type":"text","text":"..."}]}}
+    msg = event.get("message")
+    if isinstance(msg, dict):
+        content = msg.get("content")
+        if isinstance(content, list):
+            parts = [
+                item["text"]
+                for item in content
+                if isinstance(item, dict) and isinstance(item.get("text"), str)
+            ]
+            if parts:
+                return "assistant", "".join(parts)
+
+    return kind, None
+
+
+def stream_cursor_output(chunks: Iterable[bytes], *, env: Mapping[str, str]) -> str:
+    """
+    Echo `cursor-agent` output to stdout as it arrives and return what was shown.
+
+    With `--output-format stream-json`, only a human-friendly subset (assistant text,
+    optionally thinking) is printed unless `CURSOR_STREAM_MODE=raw`. Output is read
+    in chunks and stdout is flushed once per chunk rather than once per event.
+    """
+    stream_mode = (env.get("CURSOR_STREAM_MODE") or "assistant").lower().strip()
+    show_thinking = (env.get("CURSOR_STREAM_SHOW_THINKING") or "").strip().lower() in (
+        "1",
+        "true",
+        "yes",
+        "y",
+    )
+    raw_mode = stream_mode == "raw"
+    assistant_only = stream_mode == "assistant"
+
+    # Locals for the per-event loop, which can see thousands of deltas per run.
+    raw_chunks: list[str] = []
+    text_chunks: list[str] = []
+    append_raw = raw_chunks.append
+    append_text = text_chunks.append
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    raw_decode = _DECODER.raw_decode
+    extract_text = _extract_text
+
+    for lines in iter_line_batches(chunks):
+        for line in lines:
+            if raw_mode:
+                append_raw(line)
+                write(line)
+                continue
+
+            # Best-effort: parse stream-json and print a human-friendly subset.
+            stripped = line.strip()
+            if not stripped:
+                continue
+            # stream-json is one event per line; raw_decode skips json.loads'
+            # per-call dispatch. Trailing junk means it wasn't a single event.
+            # Events are objects, so plain-text lines skip the decoder (and the
+            # exception path) entirely.
+            event = None
+            if stripped[0] == "{":
+                try:
+                    event, end = raw_decode(stripped)
+                except json.JSONDecodeError:
+                    pass
+                else:
+                    if end != len(stripped):
+                        event = None
+            if not isinstance(event, dict):
+                # Not a JSON object: print as-is.
+                append_raw(line)
+                write(line)
+                continue
+
+            kind, text = extract_text(event)
+            if kind == "thinking" and not show_thinking:
+                continue
+            # Only show assistant-ish text (and optionally thinking).
+            if assistant_only and kind not in _ASSISTANT_KINDS:
+                continue
+            if text:
+                append_text(text)
+                write(text)
+        flush()
+    return "".join(raw_chunks) if raw_mode else "".join(text_chunks)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 
 from .base import EvaluateAgent
 from .cursor_agent import CursorEvaluateAgent
@@ -9,11 +10,16 @@ from pr_creator.cursor_utils.runners import get_cursor_runner
 DEFAULT_AGENT = "cursor"
 
 
-def get_evaluate_agent(name: str | None = None) -> EvaluateAgent:
-    agent_name = (name or os.environ.get("EVALUATE_AGENT") or DEFAULT_AGENT).lower()
+@lru_cache(maxsize=None)
+def _get_evaluate_agent_cached(agent_name: str) -> EvaluateAgent:
     if agent_name == "cursor":
         return CursorEvaluateAgent(get_cursor_runner())
     raise ValueError(f"Unknown evaluate agent: {agent_name}")
 
 
+def get_evaluate_agent(name: str | None = None) -> EvaluateAgent:
+    agent_name = (name or os.environ.get("EVALUATE_AGENT") or DEFAULT_AGENT).lower()
+    return _get_evaluate_agent_cached(agent_name)
+
+
 __all__ = ["EvaluateAgent", "CursorEvaluateAgent", "get_evaluate_agent"]
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import logging
+import re
 from pathlib import Path
 
 from .base import EvaluateAgent
 from pr_creator.cursor_utils.runners import CursorRunner, get_cursor_runner
+from pr_creator.workspace_mounts import resolve_host_path
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +16,7 @@ class CursorEvaluateAgent(EvaluateAgent):
         self._runner = runner or get_cursor_runner()
 
     def evaluate(self, repo_path: Path, relevance_prompt: str) -> bool:
-        repo_abs = str(repo_path.resolve())
+        repo_abs = resolve_host_path(str(repo_path))
         prompt = (
             "You are evaluating whether a repository is relevant to an objective.\n"
             f"Objective: {relevance_prompt}\n\n"
@@ -38,35 +40,51 @@ class CursorEvaluateAgent(EvaluateAgent):
         return decision
 
 
+_BOLD_YES_RE = re.compile(r"\*\*(?:yes|y)\*\*", re.IGNORECASE)
+_BOLD_NO_RE = re.compile(r"\*\*(?:no|n)\*\*", re.IGNORECASE)
+# Words are runs of characters other than whitespace, "." and ",".
+_WORD_RE = re.compile(r"[^\s.,]+")
+_DECISION_RE = re.compile(
+    r"(?<![^\s.,])(yes|y|true|no|n|false)(?![^\s.,])", re.IGNORECASE
+)
+_YES_WORDS = frozenset(("yes", "y", "true"))
+_NO_WORDS = frozenset(("no", "n", "false"))
+# Enough trailing text to hold the last 10 words of a typical answer.
+_TAIL_CHARS = 2048
+
+
+def _last_words(output: str, count: int) -> list[str]:
+    if len(output) > _TAIL_CHARS:
+        words = _WORD_RE.findall(output, len(output) - _TAIL_CHARS)
+        # The first word may be cut off by the window; only trust the rest.
+        if len(words) > count:
+            return words[-count:]
+    return _WORD_RE.findall(output)[-count:]
+
+
 def _parse_decision(output: str) -> bool:
     """
     Parse the decision from Cursor agent output.
     Prioritizes final answer markers like **yes** or **no**, then checks from the end backwards.
     """
-    output_lower = output.lower()
-
     # First, check for bold markers (common format for final answers)
-    if "**yes**" in output_lower or "**y**" in output_lower:
+    if _BOLD_YES_RE.search(output):
         return True
-    if "**no**" in output_lower or "**n**" in output_lower:
+    if _BOLD_NO_RE.search(output):
         return False
 
-    # Parse from the end backwards to find the final answer
-    # This handles cases where "yes" or "no" appear in the middle of reasoning
-    words = output_lower.replace(".", " ").replace(",", " ").split()
-
-    # Check last 10 words first (likely to contain the final answer)
-    for word in reversed(words[-10:]):
-        if word in {"yes", "y", "true"}:
+    # Check the last 10 words first (likely to contain the final answer). This
+    # handles cases where "yes" or "no" appear in the middle of reasoning.
+    for word in reversed(_last_words(output, 10)):
+        word = word.lower()
+        if word in _YES_WORDS:
             return True
-        if word in {"no", "n", "false"}:
+        if word in _NO_WORDS:
             return False
 
-    # Fallback: check all words (original behavior)
-    for word in words:
-        if word in {"yes", "y", "true"}:
-            return True
-        if word in {"no", "n", "false"}:
-            return False
+    # Fallback: first yes/no word anywhere (original behavior)
+    m = _DECISION_RE.search(output)
+    if m:
+        return m.group(1).lower() in _YES_WORDS
 
     return False
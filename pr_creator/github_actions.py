@@ -1,17 +1,20 @@
 from __future__ import annotations
 
+import codecs
 import io
 import json
 import logging
 import os
 import re
+import threading
 import time
-import urllib.error
-import urllib.request
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import urllib3
+
 logger = logging.getLogger(__name__)
 
 _PR_URL_RE = re.compile(
@@ -20,6 +23,16 @@ _PR_URL_RE = re.compile(
 _ACTIONS_DETAILS_RE = re.compile(
     r"/actions/runs/(?P<run_id>\d+)(?:/job/(?P<job_id>\d+))?"
 )
+_MAX_LOG_DOWNLOAD_WORKERS = 8
+_PENDING_STATUSES = frozenset(("queued", "in_progress"))
+# Read size used while checking whether an oversized log entry is whitespace only.
+_BLANK_SCAN_BYTES = 64 * 1024
+
+# Conditional-request cache for polled GitHub API GETs: url -> (etag, parsed json).
+# A 304 reply is cheap and doesn't count against the primary rate limit.
+_ETAG_CACHE_MAX = 256
+_etag_cache: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+_etag_lock = threading.Lock()
 
 
 @dataclass(frozen=True)
@@ -32,11 +45,21 @@ class CiWaitConfig:
     acceptable_conclusions: Tuple[str, ...] = ("success", "skipped", "neutral")
 
 
-def _env_int(name: str, default: int) -> int:
+def _env_int(name: str, default: int, *, minimum: Optional[int] = None) -> int:
     try:
-        return int(os.environ.get(name, str(default)).strip())
+        value = int(os.environ.get(name, str(default)).strip())
     except Exception:
         return default
+    if minimum is not None and value < minimum:
+        logger.warning(
+            "%s=%s is below the minimum of %s; defaulting to %s",
+            name,
+            value,
+            minimum,
+            default,
+        )
+        return default
+    return value
 
 
 def load_ci_wait_config() -> CiWaitConfig:
@@ -50,7 +73,7 @@ def load_ci_wait_config() -> CiWaitConfig:
         timeout_seconds=_env_int("CI_WAIT_TIMEOUT_SECONDS", 30 * 60),
         poll_seconds=_env_int("CI_WAIT_POLL_SECONDS", 15),
         heartbeat_seconds=_env_int("CI_WAIT_HEARTBEAT_SECONDS", 120),
-        max_log_bytes=_env_int("CI_MAX_LOG_BYTES", 5_000_000),
+        max_log_bytes=_env_int("CI_MAX_LOG_BYTES", 5_000_000, minimum=1),
         max_log_chars=_env_int("CI_MAX_LOG_CHARS", 30_000),
         acceptable_conclusions=conclusions,
     )
@@ -63,9 +86,11 @@ def parse_pr_url(pr_url: str) -> Optional[Tuple[str, str, int]]:
     return (m.group("owner"), m.group("repo"), int(m.group("number")))
 
 
-class _NoRedirect(urllib.request.HTTPRedirectHandler):
-    def redirect_request(self, req, fp, code, msg, headers, newurl):
-        return None
+# One keep-alive connection pool per host (api.github.com, the log storage host),
+# shared by the CI polling loop and the log download threads.
+_HTTP = urllib3.PoolManager(
+    num_pools=4, maxsize=_MAX_LOG_DOWNLOAD_WORKERS, retries=False
+)
 
 
 def _request(
@@ -74,41 +99,65 @@ def _request(
     token: Optional[str],
     accept: str = "application/vnd.github+json",
     timeout: int = 30,
+    etag: Optional[str] = None,
+    extra_headers: Optional[Dict[str, str]] = None,
+    max_bytes: Optional[int] = None,
 ) -> Tuple[int, Dict[str, str], bytes]:
     headers = {"Accept": accept, "User-Agent": "pr-creator"}
     if token:
         headers["Authorization"] = f"Bearer {token}"
-    req = urllib.request.Request(url, headers=headers)
-    opener = urllib.request.build_opener(_NoRedirect)
+    if etag:
+        headers["If-None-Match"] = etag
+    if extra_headers:
+        headers.update(extra_headers)
+    # Redirects are returned to the caller (log downloads must drop the token).
+    resp = _HTTP.request(
+        "GET",
+        url,
+        headers=headers,
+        redirect=False,
+        timeout=float(timeout),
+        preload_content=max_bytes is None,
+    )
+    if max_bytes is None:
+        return resp.status, dict(resp.headers.items()), resp.data
     try:
-        with opener.open(req, timeout=timeout) as resp:
-            status = getattr(resp, "status", 200)
-            hdrs = {k: v for k, v in resp.headers.items()}
-            body = resp.read()
-            return status, hdrs, body
-    except urllib.error.HTTPError as e:
-        body = e.read() if hasattr(e, "read") else b""
-        hdrs = (
-            {k: v for k, v in getattr(e, "headers", {}).items()}
-            if getattr(e, "headers", None)
-            else {}
-        )
-        return int(getattr(e, "code", 500)), hdrs, body
+        body = resp.read(max_bytes)
+    finally:
+        # Drop the connection rather than draining a body we won't use.
+        resp.close()
+        resp.release_conn()
+    return resp.status, dict(resp.headers.items()), body
 
 
 def _get_json(url: str, *, token: str) -> Dict[str, Any]:
-    status, headers, body = _request(url, token=token)
+    with _etag_lock:
+        cached = _etag_cache.get(url)
+    status, headers, body = _request(
+        url, token=token, etag=cached[0] if cached else None
+    )
+    if status == 304 and cached:
+        return cached[1]
     if status >= 400:
         raise RuntimeError(
             f"GitHub API request failed ({status}) for {url}: {body[:500]!r}"
         )
     try:
-        return json.loads(body.decode("utf-8"))
+        data = json.loads(body.decode("utf-8"))
     except Exception as exc:
         raise RuntimeError(f"Failed to parse GitHub JSON response for {url}") from exc
+    etag = headers.get("ETag") or headers.get("etag")
+    if etag:
+        with _etag_lock:
+            if len(_etag_cache) >= _ETAG_CACHE_MAX:
+                _etag_cache.clear()
+            _etag_cache[url] = (etag, data)
+    return data
 
 
 def _get_bytes_follow_redirect(url: str, *, token: str, max_bytes: int) -> bytes:
+    # A non-positive max_bytes means no limit ("bytes=0--1" is not a valid Range).
+    limited = max_bytes > 0
     status, headers, body = _request(url, token=token)
     if status in (301, 302, 303, 307, 308):
         loc = headers.get("Location") or headers.get("location")
@@ -116,17 +165,61 @@ def _get_bytes_follow_redirect(url: str, *, token: str, max_bytes: int) -> bytes
             raise RuntimeError(
                 f"GitHub logs redirect missing Location header for {url}"
             )
-        status2, _headers2, body2 = _request(loc, token=None)
+        # Log storage honours Range, so only the bytes we keep cross the wire.
+        status2, _headers2, body2 = _request(
+            loc,
+            token=None,
+            extra_headers={"Range": f"bytes=0-{max_bytes - 1}"} if limited else None,
+            max_bytes=max_bytes if limited else None,
+        )
         if status2 >= 400:
             raise RuntimeError(
                 f"Failed to fetch redirected logs ({status2}) from {loc}"
             )
-        return body2[:max_bytes]
+        return body2
     if status >= 400:
         raise RuntimeError(
             f"Failed to fetch logs ({status}) from {url}: {body[:200]!r}"
         )
-    return body[:max_bytes]
+    return body[:max_bytes] if limited else body
+
+
+def _read_text_prefix(
+    zf: zipfile.ZipFile, name: str, max_chars: int
+) -> Tuple[str, bool, bool]:
+    """
+    Decode about `max_chars` characters of an archive entry without inflating the
+    rest of it. Returns (text, complete, blank): `complete` means the whole entry was
+    decoded and `blank` that it is whitespace only.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    parts: list[str] = []
+    got = 0
+    blank = True
+    dropped = False
+    with zf.open(name) as fh:
+        # Keep reading past the budget only while the entry still looks blank.
+        while got < max_chars or blank:
+            # Each char takes at least one byte, so this never overshoots.
+            raw = fh.read(max(max_chars - got, 0) or _BLANK_SCAN_BYTES)
+            if not raw:
+                tail = decoder.decode(b"", final=True)
+                if tail and not dropped:
+                    parts.append(tail)
+                    blank = blank and tail.isspace()
+                return "".join(parts), not dropped, blank
+            text = decoder.decode(raw)
+            if text and blank and not text.isspace():
+                blank = False
+            if got < max_chars:
+                parts.append(text)
+                got += len(text)
+            elif text:
+                dropped = True
+        complete = not dropped and not fh.read(1)
+    if complete:
+        parts.append(decoder.decode(b"", final=True))
+    return "".join(parts), complete, blank
 
 
 def _extract_zip_text(data: bytes, *, max_chars: int) -> str:
@@ -136,21 +229,39 @@ def _extract_zip_text(data: bytes, *, max_chars: int) -> str:
         # Not a zip; treat as text
         return data.decode("utf-8", errors="replace")[:max_chars]
 
-    chunks: list[str] = []
+    # Output is written straight into one buffer, capped just past `max_chars`
+    # (enough to tell whether the result needs truncating).
+    limit = max_chars + 2
+    buf = io.StringIO()
+    written = 0
+    # Entry sections seen so far (excluding separators); stop once past max_chars.
+    total = 0
     for name in sorted(zf.namelist()):
+        if written >= limit:
+            break
         if name.endswith("/"):
             continue
         try:
-            raw = zf.read(name)
+            text, complete, blank = _read_text_prefix(zf, name, limit - written)
         except Exception:
             continue
-        text = raw.decode("utf-8", errors="replace")
-        if text.strip():
-            chunks.append(f"--- {name} ---\n{text.rstrip()}\n")
-        if sum(len(c) for c in chunks) >= max_chars:
+        if blank:
+            if total >= max_chars:
+                break
+            continue
+        if complete:
+            text = text.rstrip()
+        section = f"--- {name} ---\n{text}\n"
+        total += len(section)
+        chunk = (f"\n{section}" if written else section)[: limit - written]
+        buf.write(chunk)
+        written += len(chunk)
+        if total >= max_chars:
             break
 
-    combined = "\n".join(chunks).strip()
+    combined = buf.getvalue()
+    if written < limit:
+        combined = combined.strip()
     if len(combined) > max_chars:
         combined = combined[:max_chars].rstrip() + "\n... (truncated)"
     return combined
@@ -200,11 +311,9 @@ def _failed_check_runs(
 def _has_pending(check_runs: Iterable[Dict[str, Any]], combined_state: str) -> bool:
     if combined_state == "pending":
         return True
-    for cr in check_runs:
-        status = str(cr.get("status") or "").lower()
-        if status in ("queued", "in_progress"):
-            return True
-    return False
+    return any(
+        str(cr.get("status") or "").lower() in _PENDING_STATUSES for cr in check_runs
+    )
 
 
 def _parse_actions_ids(details_url: str | None) -> Tuple[Optional[str], Optional[str]]:
@@ -226,12 +335,60 @@ def _filter_check_runs_for_head_sha(
     """
     filtered: list[Dict[str, Any]] = []
     for cr in check_runs:
-        cr_sha = cr.get("head_sha") or (cr.get("check_suite") or {}).get("head_sha")
-        if cr_sha and str(cr_sha) == head_sha:
+        cr_sha = cr.get("head_sha")
+        if not cr_sha:
+            suite = cr.get("check_suite")
+            cr_sha = suite.get("head_sha") if suite else None
+        # SHAs are JSON strings, so compare directly.
+        if cr_sha == head_sha:
             filtered.append(cr)
     return filtered
 
 
+def _failed_check_parts(
+    owner: str, repo: str, cr: Dict[str, Any], *, token: str, cfg: CiWaitConfig
+) -> List[str]:
+    parts: list[str] = []
+    name = cr.get("name") or cr.get("app", {}).get("name") or "check"
+    conclusion = cr.get("conclusion") or "unknown"
+    details_url = cr.get("details_url") or ""
+    output = cr.get("output") or {}
+    summary = (output.get("summary") or "").strip()
+    text = (output.get("text") or "").strip()
+
+    parts.append(
+        f"### Failed check: {name}\n- conclusion: {conclusion}\n- details: {details_url}\n"
+    )
+    if summary:
+        parts.append(f"#### Output summary\n{summary}\n")
+    if text and text != summary:
+        parts.append(f"#### Output text\n{text}\n")
+
+    run_id, job_id = _parse_actions_ids(details_url)
+    try:
+        if job_id:
+            data = _get_bytes_follow_redirect(
+                f"{_api_base(owner, repo)}/actions/jobs/{job_id}/logs",
+                token=token,
+                max_bytes=cfg.max_log_bytes,
+            )
+            extracted = _extract_zip_text(data, max_chars=cfg.max_log_chars)
+            if extracted.strip():
+                parts.append("#### Job logs\n" + extracted + "\n")
+        elif run_id:
+            data = _get_bytes_follow_redirect(
+                f"{_api_base(owner, repo)}/actions/runs/{run_id}/logs",
+                token=token,
+                max_bytes=cfg.max_log_bytes,
+            )
+            extracted = _extract_zip_text(data, max_chars=cfg.max_log_chars)
+            if extracted.strip():
+                parts.append("#### Run logs\n" + extracted + "\n")
+    except Exception as exc:
+        logger.warning("[ci] failed to download logs for %s: %s", details_url, exc)
+    return parts
+
+
 def fetch_failed_logs_snippet(
     owner: str,
     repo: str,
@@ -240,49 +397,38 @@ def fetch_failed_logs_snippet(
     token: str,
     cfg: CiWaitConfig,
 ) -> str:
-    parts: list[str] = []
-    for cr in failed_check_runs:
-        name = cr.get("name") or cr.get("app", {}).get("name") or "check"
-        conclusion = cr.get("conclusion") or "unknown"
-        details_url = cr.get("details_url") or ""
-        output = cr.get("output") or {}
-        summary = (output.get("summary") or "").strip()
-        text = (output.get("text") or "").strip()
-
-        parts.append(
-            f"### Failed check: {name}\n- conclusion: {conclusion}\n- details: {details_url}\n"
+    if not failed_check_runs:
+        return ""
+    # Log archives are fetched concurrently (they're network-bound); `map` keeps
+    # the output in check-run order.
+    workers = min(_MAX_LOG_DOWNLOAD_WORKERS, len(failed_check_runs))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        per_check = pool.map(
+            lambda cr: _failed_check_parts(owner, repo, cr, token=token, cfg=cfg),
+            failed_check_runs,
         )
-        if summary:
-            parts.append(f"#### Output summary\n{summary}\n")
-        if text and text != summary:
-            parts.append(f"#### Output text\n{text}\n")
-
-        run_id, job_id = _parse_actions_ids(details_url)
-        try:
-            if job_id:
-                data = _get_bytes_follow_redirect(
-                    f"{_api_base(owner, repo)}/actions/jobs/{job_id}/logs",
-                    token=token,
-                    max_bytes=cfg.max_log_bytes,
-                )
-                extracted = _extract_zip_text(data, max_chars=cfg.max_log_chars)
-                if extracted.strip():
-                    parts.append("#### Job logs\n" + extracted + "\n")
-            elif run_id:
-                data = _get_bytes_follow_redirect(
-                    f"{_api_base(owner, repo)}/actions/runs/{run_id}/logs",
-                    token=token,
-                    max_bytes=cfg.max_log_bytes,
-                )
-                extracted = _extract_zip_text(data, max_chars=cfg.max_log_chars)
-                if extracted.strip():
-                    parts.append("#### Run logs\n" + extracted + "\n")
-        except Exception as exc:
-            logger.warning("[ci] failed to download logs for %s: %s", details_url, exc)
+        parts = [part for check_parts in per_check for part in check_parts]
 
     return "\n".join(parts).strip()
 
 
+def _poll_interval(poll_seconds: int, stable_polls: int) -> float:
+    """
+    Adaptive poll interval around `poll_seconds`.
+
+    Poll faster (a third, at least 3s) right after the observed state changed, and
+    back off (up to 2x, capped at 60s) once it has been stable for 3 polls, e.g.
+    while long jobs are in progress.
+    """
+    if poll_seconds <= 0:
+        return 0.0
+    if stable_polls == 0:
+        return min(poll_seconds, max(3, poll_seconds // 3))
+    if stable_polls >= 3:
+        return max(poll_seconds, min(poll_seconds * 2, 60))
+    return poll_seconds
+
+
 def wait_for_ci(
     pr_url: str,
     *,
@@ -295,11 +441,16 @@ def wait_for_ci(
         return True, f"[ci] skipping wait: could not parse PR url: {pr_url}"
     owner, repo, pr_number = parsed
 
-    deadline = time.time() + cfg.timeout_seconds
+    start_monotonic = time.monotonic()
+    deadline = start_monotonic + cfg.timeout_seconds
     last_state = "unknown"
     last_counts = ""
-    start_monotonic = time.monotonic()
     last_heartbeat = 0.0
+    last_fingerprint: Tuple[Any, ...] | None = None
+    stable_polls = 0
+
+    def _sleep(seconds: float) -> None:
+        time.sleep(max(0.0, min(seconds, deadline - time.monotonic())))
 
     def _format_check_run(cr: Dict[str, Any]) -> str:
         name = str(cr.get("name") or cr.get("app", {}).get("name") or "check")
@@ -336,7 +487,7 @@ def wait_for_ci(
         pending_runs = [
             cr
             for cr in check_runs
-            if str(cr.get("status") or "").lower() in ("queued", "in_progress")
+            if str(cr.get("status") or "").lower() in _PENDING_STATUSES
         ]
         pending_preview = ", ".join(_format_check_run(cr) for cr in pending_runs[:6])
         failed_preview = ", ".join(_format_check_run(cr) for cr in failed[:4])
@@ -352,83 +503,103 @@ def wait_for_ci(
             f" failed_runs=[{failed_preview}]" if failed_preview else "",
         )
 
-    while time.time() < deadline:
-        sha = get_pr_head_sha(owner, repo, pr_number, token=token)
-        if expected_head_sha and sha != expected_head_sha:
-            # Avoid evaluating CI on a stale PR head (GitHub can lag right after a push,
-            # or the PR may be pointing at a different head ref than what we just pushed).
-            last_state = "waiting_for_pr_head_update"
-            last_counts = (
-                f"pr_head_sha={sha} expected_head_sha={expected_head_sha} (waiting)"
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        while time.monotonic() < deadline:
+            sha = get_pr_head_sha(owner, repo, pr_number, token=token)
+            if expected_head_sha and sha != expected_head_sha:
+                # Avoid evaluating CI on a stale PR head (GitHub can lag right after a push,
+                # or the PR may be pointing at a different head ref than what we just pushed).
+                last_state = "waiting_for_pr_head_update"
+                last_counts = (
+                    f"pr_head_sha={sha} expected_head_sha={expected_head_sha} (waiting)"
+                )
+                # Still waiting; emit an occasional heartbeat so long waits are visible.
+                if cfg.heartbeat_seconds > 0:
+                    now = time.monotonic()
+                    if (
+                        not last_heartbeat
+                        or (now - last_heartbeat) >= cfg.heartbeat_seconds
+                    ):
+                        last_heartbeat = now
+                        elapsed_s = int(now - start_monotonic)
+                        logger.info(
+                            "[ci] heartbeat: pr=%s state=%s elapsed=%ss (%s)",
+                            pr_url,
+                            last_state,
+                            elapsed_s,
+                            last_counts,
+                        )
+                # GitHub usually catches up within seconds of a push.
+                _sleep(_poll_interval(cfg.poll_seconds, stable_polls=0))
+                continue
+            # Both depend only on the head SHA; fetch them in parallel (one RTT per poll).
+            check_runs_future = pool.submit(
+                get_check_runs, owner, repo, sha, token=token
             )
-            # Still waiting; emit an occasional heartbeat so long waits are visible.
-            if cfg.heartbeat_seconds > 0:
-                now = time.monotonic()
-                if (
-                    not last_heartbeat
-                    or (now - last_heartbeat) >= cfg.heartbeat_seconds
-                ):
-                    last_heartbeat = now
-                    elapsed_s = int(now - start_monotonic)
-                    logger.info(
-                        "[ci] heartbeat: pr=%s state=%s elapsed=%ss (%s)",
-                        pr_url,
-                        last_state,
-                        elapsed_s,
-                        last_counts,
-                    )
-            time.sleep(cfg.poll_seconds)
-            continue
-        check_runs_all = get_check_runs(owner, repo, sha, token=token)
-        check_runs = _filter_check_runs_for_head_sha(check_runs_all, sha)
-        combined_state = get_combined_status(owner, repo, sha, token=token)
-
-        pending = _has_pending(check_runs, combined_state)
-        failed = _failed_check_runs(check_runs, cfg.acceptable_conclusions)
-        last_state = combined_state
-        last_counts = (
-            f"checks={len(check_runs)} failed={len(failed)} state={combined_state}"
-        )
-
-        if pending:
-            _heartbeat(
-                pr_url=pr_url,
-                sha=sha,
-                combined_state=combined_state,
-                check_runs=check_runs,
-                failed=failed,
+            combined_state = get_combined_status(owner, repo, sha, token=token)
+            check_runs = _filter_check_runs_for_head_sha(
+                check_runs_future.result(), sha
             )
 
-        if not pending:
-            # If there are any checks, require no failures. If there are no checks,
-            # treat combined status as the source of truth.
-            if check_runs and not failed:
-                return True, f"[ci] all checks passed for {pr_url} ({last_counts})"
-            if check_runs and failed:
-                snippet = fetch_failed_logs_snippet(
-                    owner, repo, failed, token=token, cfg=cfg
-                )
-                return False, (
-                    "CI failed for this PR.\n\n"
-                    f"- PR: {pr_url}\n"
-                    f"- head_sha: {sha}\n"
-                    f"- summary: {last_counts}\n\n" + (snippet or "No logs available.")
-                )
-            # No check runs: rely on combined status.
-            if combined_state == "success":
-                return (
-                    True,
-                    f"[ci] no check-runs found; combined status is success for {pr_url}",
-                )
-            if combined_state in ("failure", "error"):
-                return False, (
-                    "CI failed for this PR (commit status).\n\n"
-                    f"- PR: {pr_url}\n"
-                    f"- head_sha: {sha}\n"
-                    f"- status: {combined_state}\n"
+            pending = _has_pending(check_runs, combined_state)
+            failed = _failed_check_runs(check_runs, cfg.acceptable_conclusions)
+            last_state = combined_state
+            last_counts = (
+                f"checks={len(check_runs)} failed={len(failed)} state={combined_state}"
+            )
+            fingerprint = (
+                sha,
+                combined_state,
+                len(check_runs),
+                len(failed),
+                sum(
+                    str(cr.get("status") or "").lower() in _PENDING_STATUSES
+                    for cr in check_runs
+                ),
+            )
+            stable_polls = stable_polls + 1 if fingerprint == last_fingerprint else 0
+            last_fingerprint = fingerprint
+
+            if pending:
+                _heartbeat(
+                    pr_url=pr_url,
+                    sha=sha,
+                    combined_state=combined_state,
+                    check_runs=check_runs,
+                    failed=failed,
                 )
 
-        time.sleep(cfg.poll_seconds)
+            if not pending:
+                # If there are any checks, require no failures. If there are no checks,
+                # treat combined status as the source of truth.
+                if check_runs and not failed:
+                    return True, f"[ci] all checks passed for {pr_url} ({last_counts})"
+                if check_runs and failed:
+                    snippet = fetch_failed_logs_snippet(
+                        owner, repo, failed, token=token, cfg=cfg
+                    )
+                    return False, (
+                        "CI failed for this PR.\n\n"
+                        f"- PR: {pr_url}\n"
+                        f"- head_sha: {sha}\n"
+                        f"- summary: {last_counts}\n\n"
+                        + (snippet or "No logs available.")
+                    )
+                # No check runs: rely on combined status.
+                if combined_state == "success":
+                    return (
+                        True,
+                        f"[ci] no check-runs found; combined status is success for {pr_url}",
+                    )
+                if combined_state in ("failure", "error"):
+                    return False, (
+                        "CI failed for this PR (commit status).\n\n"
+                        f"- PR: {pr_url}\n"
+                        f"- head_sha: {sha}\n"
+                        f"- status: {combined_state}\n"
+                    )
+
+            _sleep(_poll_interval(cfg.poll_seconds, stable_polls))
 
     expected_line = (
         f"- expected_head_sha: {expected_head_sha}\n" if expected_head_sha else ""
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+from github import Auth, Github
+from github.Repository import Repository
+
+# GitHub's maximum page size: paginated listings (PRs, check runs) take a third of
+# the round-trips of PyGithub's default of 30.
+_PER_PAGE = 100
+# Keep-alive connections per client; concurrent repo lanes and thread pools share it.
+_POOL_SIZE = 16
+
+
+@lru_cache(maxsize=8)
+def get_github(token: str) -> Github:
+    """
+    Shared PyGithub client per token.
+
+    Each `Github` instance owns its own HTTP connection pool, so reusing one across
+    prompt-config loading, workspace setup and submission keeps connections (and
+    TLS sessions) to the GitHub API alive for the whole run.
+    """
+    return Github(auth=Auth.Token(token), per_page=_PER_PAGE, pool_size=_POOL_SIZE)
+
+
+@lru_cache(maxsize=64)
+def get_repo(token: str, slug: str) -> Repository:
+    """
+    Shared `Repository` per token and slug.
+
+    Workspace setup and submission each need the same repository (and its
+    `default_branch`); caching it saves a `GET /repos/{slug}` per lookup. Failed
+    lookups raise and are not cached.
+    """
+    return get_github(token).get_repo(slug)
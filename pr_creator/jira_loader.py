@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import os
+from functools import lru_cache
 from typing import Dict, Optional
 
 from jira import JIRA
@@ -9,6 +10,17 @@ from jira import JIRA
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _jira_client(base_url: str, email: str, api_token: str, timeout: int) -> JIRA:
+    """Reuse one authenticated client (and its HTTP session) per Jira site/user."""
+    return JIRA(
+        server=base_url,
+        basic_auth=(email, api_token),
+        options={"rest_api_version": "3"},
+        timeout=timeout,
+    )
+
+
 def load_prompt_from_jira(
     base_url: Optional[str],
     ticket_id: str,
@@ -34,11 +46,8 @@ def load_prompt_from_jira(
         normalized_base = f"https://{normalized_base.lstrip('/')}"
 
     logger.info("Fetching Jira ticket %s from %s", ticket_id, normalized_base)
-    jira_client = JIRA(
-        server=normalized_base,
-        basic_auth=(resolved_email or "", resolved_token or ""),
-        options={"rest_api_version": "3"},
-        timeout=timeout,
+    jira_client = _jira_client(
+        normalized_base, resolved_email or "", resolved_token or "", timeout
     )
 
     issue = jira_client.issue(
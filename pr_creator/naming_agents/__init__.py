@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 
 from .base import NamingAgent
 from .cursor_agent import CursorNamingAgent
@@ -9,11 +10,16 @@ from pr_creator.cursor_utils.runners import get_cursor_runner
 DEFAULT_AGENT = "cursor"
 
 
-def get_naming_agent(name: str | None = None) -> NamingAgent:
-    agent_name = (name or os.environ.get("NAMING_AGENT") or DEFAULT_AGENT).lower()
+@lru_cache(maxsize=None)
+def _get_naming_agent_cached(agent_name: str) -> NamingAgent:
     if agent_name == "cursor":
         return CursorNamingAgent(get_cursor_runner())
     raise ValueError(f"Unknown naming agent: {agent_name}")
 
 
+def get_naming_agent(name: str | None = None) -> NamingAgent:
+    agent_name = (name or os.environ.get("NAMING_AGENT") or DEFAULT_AGENT).lower()
+    return _get_naming_agent_cached(agent_name)
+
+
 __all__ = ["NamingAgent", "CursorNamingAgent", "get_naming_agent"]
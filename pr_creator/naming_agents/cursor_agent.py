@@ -2,25 +2,46 @@ from __future__ import annotations
 
 import json
 import logging
+import re
 
 from pr_creator.cursor_utils.runners import CursorRunner, get_cursor_runner
 from .base import NamingAgent
 
 logger = logging.getLogger(__name__)
 
+_INSTRUCTION = (
+    "You are generating a short description for a change prompt.\n"
+    "- Produce a single JSON object ONLY, no extra text.\n"
+    '- Shape: {"short_desc": "<kebab-case-phrase>"}\n'
+    "- short_desc: 3-6 words, lowercase, kebab-case, no punctuation beyond hyphens."
+)
+_JSON_OBJECT = re.compile(r"\{[^{}]*\}")
+# The expected one-key object with a plain (escape-free) string value.
+_SHORT_DESC_OBJECT = re.compile(r'\{\s*"short_desc"\s*:\s*"([^"\\]*)"\s*\}')
+
+
+def _parse_short_desc(output: str) -> str | None:
+    text = output.strip()
+    matches = _SHORT_DESC_OBJECT.findall(text)
+    if matches:
+        return matches[-1] or None
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        # Tolerate prose around the object by falling back to the last {...} block.
+        objects = _JSON_OBJECT.findall(text)
+        if not objects:
+            raise
+        data = json.loads(objects[-1])
+    return data.get("short_desc") or None
+
 
 class CursorNamingAgent(NamingAgent):
     def __init__(self, runner: CursorRunner | None = None) -> None:
         self._runner = runner or get_cursor_runner()
 
     def generate_short_desc(self, prompt: str) -> str | None:
-        instruction = (
-            "You are generating a short description for a change prompt.\n"
-            "- Produce a single JSON object ONLY, no extra text.\n"
-            '- Shape: {"short_desc": "<kebab-case-phrase>"}\n'
-            "- short_desc: 3-6 words, lowercase, kebab-case, no punctuation beyond hyphens."
-        )
-        full_prompt = f"{instruction}\n\nPrompt:\n{prompt}"
+        full_prompt = f"{_INSTRUCTION}\n\nPrompt:\n{prompt}"
         try:
             output = self._runner.run_prompt(
                 full_prompt,
@@ -32,8 +53,7 @@ class CursorNamingAgent(NamingAgent):
                 stream_partial_output=False,
             )
             logger.info("Name generation output: %s", output.strip())
-            data = json.loads(output)
-            return data.get("short_desc") or None
+            return _parse_short_desc(output)
         except Exception as e:
             logger.warning("Name generation failed, returning None: %s", e)
             return None
@@ -14,10 +14,10 @@ def merge_base_prompt_with_cli_prompt(
     - CLI prompt is highest priority instructions
     - base prompt is background/context
     """
-    base = (base_prompt or "").strip()
     cli = (cli_prompt or "").strip()
     if not cli:
         return base_prompt
+    base = (base_prompt or "").strip()
     return (
         "## Highest priority instructions (CLI)\n"
         f"{cli}\n\n"
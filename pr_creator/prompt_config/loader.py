@@ -5,9 +5,10 @@ import os
 from typing import Any, Dict, Optional
 
 import yaml
-from github import Auth, Github
 from github.GithubException import GithubException
 
+from pr_creator.github_client import get_repo
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,9 +19,8 @@ def _load_yaml_from_github(
         logger.warning("GITHUB_TOKEN not set; cannot load private GitHub config")
         return {}
     repo_slug = f"{owner}/{repo_name}"
-    gh = Github(auth=Auth.Token(token))
     try:
-        repo = gh.get_repo(repo_slug)
+        repo = get_repo(token, repo_slug)
         content_file = repo.get_contents(path, ref=ref)
         return yaml.safe_load(content_file.decoded_content) or {}
     except GithubException as exc:
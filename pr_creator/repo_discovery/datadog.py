@@ -1,50 +1,58 @@
 from __future__ import annotations
 
 import logging
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, List, Optional, Union
+from urllib.parse import urlsplit
 
+from datadog_api_client.model_utils import OpenApiModel
 from datadog_api_client.v2 import ApiClient, Configuration
 from datadog_api_client.v2.api.service_definition_api import ServiceDefinitionApi
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_DATADOG_SITE = "datadoghq.com"
+# Largest page size the service definitions API allows.
+_PAGE_SIZE = 100
+# Pages requested concurrently. The API reports no total count, so pages are fetched
+# in windows and iteration stops at the first short page.
+_PAGE_WINDOW = 4
 
+# Services are read with `.get(...)` at every level, which dicts and the client's
+# response models both support, so models are never converted with `to_dict()`.
+ServiceLike = Union[dict, OpenApiModel]
 
-def _extract_repo_urls(service: dict) -> List[str]:
-    attrs = service.get("attributes", {})
+
+def _site_host(site: str) -> str:
+    """Turn `https://api.datadoghq.com` (or a bare `datadoghq.eu`) into the site host."""
+    site = site.strip()
+    host = urlsplit(site if "://" in site else f"//{site}").netloc
+    return host.removeprefix("api.") or DEFAULT_DATADOG_SITE
+
+
+def _extract_repo_urls(service: ServiceLike) -> Iterator[str]:
+    attrs = service.get("attributes", {}) or {}
     schema = attrs.get("schema", {}) or {}
 
     integrations = attrs.get("integrations", {}) or {}
     github = integrations.get("github", {}) or {}
-
-    candidates = [
-        github.get("url"),
-        github.get("repository_url"),
-        github.get("repository"),
-    ]
+    for key in ("url", "repository_url", "repository"):
+        url = github.get(key)
+        if url:
+            yield url
 
     # Service Catalog definitions expose repositories via the schema.
     repos = schema.get("repos", []) or attrs.get("repos", []) or []
     for repo in repos:
-        if isinstance(repo, dict):
-            candidates.append(repo.get("url"))
-
-    for repo_link in [
-        repo_link["url"]
-        for repo_link in list(
-            filter(
-                lambda link: link["type"] == "repo",
-                service.get("attributes", {}).get("schema", {}).get("links", []),
-            )
-        )
-    ]:
-        candidates.append(repo_link)
+        if isinstance(repo, (dict, OpenApiModel)) and repo.get("url"):
+            yield repo["url"]
 
-    return [c for c in candidates if c]
+    for link in schema.get("links", []) or []:
+        if link.get("type") == "repo" and link.get("url"):
+            yield link["url"]
 
 
-def _service_matches_team(service: dict, team: str) -> bool:
+def _service_matches_team(service: ServiceLike, team: str) -> bool:
     """Datadog Service Catalog service has the team on the schema."""
     attrs = service.get("attributes", {}) or {}
     schema = attrs.get("schema", {}) or {}
@@ -63,6 +71,23 @@ def _service_matches_team(service: dict, team: str) -> bool:
     )
 
 
+def _iter_service_definitions(api: ServiceDefinitionApi) -> Iterator[Any]:
+    def fetch(page_number: int) -> list:
+        resp = api.list_service_definitions(
+            page_size=_PAGE_SIZE, page_number=page_number
+        )
+        return resp.get("data") or []
+
+    with ThreadPoolExecutor(max_workers=_PAGE_WINDOW) as pool:
+        start = 0
+        while True:
+            for data in pool.map(fetch, range(start, start + _PAGE_WINDOW)):
+                yield from data
+                if len(data) < _PAGE_SIZE:
+                    return
+            start += _PAGE_WINDOW
+
+
 def discover_repos_from_datadog(
     team: str,
     api_key: Optional[str],
@@ -76,23 +101,18 @@ def discover_repos_from_datadog(
 
     config = Configuration()
     config.api_key = {"apiKeyAuth": api_key, "appKeyAuth": app_key}
-    config.server_variables["site"] = site.replace("https://", "").replace("api.", "")
+    config.server_variables["site"] = _site_host(site)
 
     repos: set[str] = set()
-    page_size = 100
 
     with ApiClient(config) as client:
         api = ServiceDefinitionApi(client)
-        for service in api.list_service_definitions_with_pagination(
-            page_size=page_size
-        ):
-            service_dict = service.to_dict() if hasattr(service, "to_dict") else service
-            if not isinstance(service_dict, dict):
+        for service in _iter_service_definitions(api):
+            if not isinstance(service, (dict, OpenApiModel)):
                 continue
-            if not _service_matches_team(service_dict, team):
+            if not _service_matches_team(service, team):
                 continue
-            for repo_url in _extract_repo_urls(service_dict):
-                repos.add(repo_url)
+            repos.update(_extract_repo_urls(service))
 
     logger.info("Datadog discovery for team %s found %d repos", team, len(repos))
     return sorted(repos)
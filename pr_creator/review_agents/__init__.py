@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 
 from .base import ReviewAgent
 from .config import DEFAULT_REVIEW_MAX_ATTEMPTS, get_review_max_attempts
@@ -10,13 +11,18 @@ from pr_creator.cursor_utils.runners import get_cursor_runner
 DEFAULT_AGENT = "cursor"
 
 
-def get_review_agent(name: str | None = None) -> ReviewAgent:
-    agent_name = (name or os.environ.get("REVIEW_AGENT") or DEFAULT_AGENT).lower()
+@lru_cache(maxsize=None)
+def _get_review_agent_cached(agent_name: str) -> ReviewAgent:
     if agent_name == "cursor":
         return CursorReviewAgent(get_cursor_runner())
     raise ValueError(f"Unknown review agent: {agent_name}")
 
 
+def get_review_agent(name: str | None = None) -> ReviewAgent:
+    agent_name = (name or os.environ.get("REVIEW_AGENT") or DEFAULT_AGENT).lower()
+    return _get_review_agent_cached(agent_name)
+
+
 __all__ = [
     "DEFAULT_REVIEW_MAX_ATTEMPTS",
     "ReviewAgent",
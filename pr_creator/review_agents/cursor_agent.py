@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import logging
+import re
 from pathlib import Path
 
 from pr_creator.cursor_utils.runners import CursorRunner, get_cursor_runner
+from pr_creator.workspace_mounts import resolve_host_path
 
 from .base import ReviewAgent
 
@@ -11,11 +13,25 @@ from .base import ReviewAgent
 logger = logging.getLogger(__name__)
 
 
+_LEADING_SPACE = re.compile(r"\s*")
+_NON_SPACE = re.compile(r"\S")
+# The line boundaries recognised by str.splitlines.
+_LINE_BREAK = re.compile(r"\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
 def _snippet(text: str, *, limit: int = 400) -> str:
-    s = (text or "").strip()
-    if len(s) <= limit:
-        return s
-    return s[:limit].rstrip() + "..."
+    """
+    `text.strip()`, cut to `limit` characters with a trailing "..." when longer.
+
+    Only the window that is shown gets copied, so logging a large agent output
+    costs a scan rather than a full stripped copy.
+    """
+    s = text or ""
+    start = _LEADING_SPACE.match(s).end()
+    window = s[start : start + limit].rstrip()
+    if _NON_SPACE.search(s, start + limit):
+        return window + "..."
+    return window
 
 
 def _parse_review_output(output: str) -> tuple[bool, str | None]:
@@ -35,13 +51,15 @@ def _parse_review_output(output: str) -> tuple[bool, str | None]:
             "Review output was empty; please re-run review and provide required fixes.",
         )
 
-    # Look at the first non-empty line as the "verdict".
-    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-    first = (lines[0] if lines else "").upper()
+    # Look at the first non-empty line as the "verdict". `text` is stripped, so that
+    # is its first line; only split that off rather than every line.
+    first_line, *rest = _LINE_BREAK.split(text, maxsplit=1)
+    first_line = first_line.strip()
+    first = first_line.upper()
     logger.info(
         "[review-agent] parsed verdict=%r (first_line=%r)",
         first,
-        lines[0] if lines else "",
+        first_line,
     )
 
     if first == "READY_TO_COMMIT":
@@ -49,7 +67,7 @@ def _parse_review_output(output: str) -> tuple[bool, str | None]:
         return False, None
 
     if first.startswith("CHANGES_REQUIRED"):
-        remainder = text.splitlines()[1:]
+        remainder = rest[0].splitlines() if rest else []
         feedback = "\n".join(remainder).strip() or None
         # If CHANGES_REQUIRED but no details, still treat as needs changes.
         logger.info(
@@ -79,7 +97,7 @@ class CursorReviewAgent(ReviewAgent):
         task_prompt: str | None = None,
         secrets: dict[str, str] | None = None,
     ) -> tuple[bool, str | None]:
-        repo_abs = str(repo_path.resolve())
+        repo_abs = resolve_host_path(str(repo_path))
         task_section = ""
         if task_prompt and task_prompt.strip():
             task_section = (
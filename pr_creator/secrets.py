@@ -32,8 +32,9 @@ def build_change_agent_secrets(
         k = key.strip()
         if not k:
             raise ValueError("Invalid --secret-env value (empty KEY)")
-        if k not in environ:
+        value = environ.get(k)
+        if value is None:
             raise ValueError(f"Missing environment variable for --secret-env: {k}")
-        out[k] = environ[k]
+        out[k] = value
 
     return out
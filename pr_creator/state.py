@@ -1,13 +1,14 @@
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowState:
     prompt: str
     relevance_prompt: str
-    repos: List[str]
+    # Queue of repos still to process; lanes take from the left.
+    repos: Deque[str]
     working_dir: Path
     # Optional CLI prompt which, when used with Jira/prompt-config, is treated as
     # highest-priority instructions.
@@ -38,6 +39,8 @@ class WorkflowState:
     processed: List[str] = field(default_factory=list)
     irrelevant: List[str] = field(default_factory=list)
     created_prs: List[Dict[str, str]] = field(default_factory=list)
+    # Most recent entry of `created_prs` per repo_url.
+    latest_prs: Dict[str, Dict[str, str]] = field(default_factory=dict)
     datadog_team: Optional[str] = None
     datadog_site: str = "datadoghq.com"
     change_id: Optional[str] = None
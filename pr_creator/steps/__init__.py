@@ -2,6 +2,7 @@ from .apply import ApplyChanges
 from .cleanup import CleanupRepo
 from .discover import DiscoverRepos
 from .evaluate import EvaluateRelevance
+from .fan_out import FanOutRepos
 from .init import InitWorkflow
 from .naming import GenerateNames
 from .next_repo import NextRepo
@@ -15,6 +16,7 @@ __all__ = [
     "CleanupRepo",
     "DiscoverRepos",
     "EvaluateRelevance",
+    "FanOutRepos",
     "InitWorkflow",
     "GenerateNames",
     "NextRepo",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
 
@@ -9,8 +10,6 @@ from pydantic_graph import BaseNode, End, GraphRunContext
 
 logger = logging.getLogger(__name__)
 
-_agent = get_change_agent()
-
 
 @dataclass
 class ApplyChanges(BaseNode):
@@ -45,7 +44,8 @@ class ApplyChanges(BaseNode):
             )
         else:
             prompt = ctx.state.prompt
-        _agent.run(
+        await asyncio.to_thread(
+            get_change_agent().run,
             path,
             prompt,
             context_roots=ctx.state.context_roots,
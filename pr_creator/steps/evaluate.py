@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from pr_creator.evaluate_agents import get_evaluate_agent
@@ -8,8 +9,6 @@ from pydantic_graph import BaseNode, End, GraphRunContext
 
 logger = logging.getLogger(__name__)
 
-_agent = get_evaluate_agent()
-
 
 @dataclass
 class EvaluateRelevance(BaseNode):
@@ -19,7 +18,9 @@ class EvaluateRelevance(BaseNode):
         path = ctx.state.cloned[self.repo_url]
         # If relevance_prompt is empty, treat all repos as relevant.
         if ctx.state.relevance_prompt:
-            is_relevant = _agent.evaluate(path, ctx.state.relevance_prompt)
+            is_relevant = await asyncio.to_thread(
+                get_evaluate_agent().evaluate, path, ctx.state.relevance_prompt
+            )
         else:
             logger.info(
                 "No relevance prompt provided; defaulting %s to relevant", self.repo_url
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+
+from pydantic_graph import BaseNode, End, GraphRunContext
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENT_REPOS = 1
+
+
+def _max_concurrent_repos() -> int:
+    raw = (os.environ.get("MAX_CONCURRENT_REPOS") or "").strip()
+    if not raw:
+        return DEFAULT_MAX_CONCURRENT_REPOS
+    try:
+        return max(1, int(raw))
+    except Exception:
+        logger.warning(
+            "Invalid MAX_CONCURRENT_REPOS=%r; defaulting to %s",
+            raw,
+            DEFAULT_MAX_CONCURRENT_REPOS,
+        )
+        return DEFAULT_MAX_CONCURRENT_REPOS
+
+
+class FanOutRepos(BaseNode):
+    """
+    Process repos in parallel "lanes".
+
+    Each lane is a sub-run of the graph starting at NextRepo and sharing the same
+    state, so lanes pull repos from the shared `state.repos` queue until it's empty.
+    Steps push their blocking work (git, Docker, GitHub) onto threads, which lets
+    lanes overlap.
+    """
+
+    async def run(self, ctx: GraphRunContext) -> BaseNode | End:
+        from .next_repo import NextRepo
+
+        lanes = min(_max_concurrent_repos(), len(ctx.state.repos))
+        if lanes <= 1:
+            return NextRepo()
+
+        from pr_creator.workflow import build_graph
+
+        logger.info("Processing %d repos across %d lanes", len(ctx.state.repos), lanes)
+        graph = build_graph()
+        tasks = [
+            asyncio.ensure_future(graph.run(NextRepo(), state=ctx.state))
+            for _ in range(lanes)
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # Stop the other lanes before the error propagates so they don't keep
+            # pulling repos and mutating the shared state. A lane's blocking step
+            # already running on a thread still finishes; asyncio.run waits for it.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return End(None)
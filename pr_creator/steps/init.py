@@ -19,6 +19,14 @@ PROMPT_SOURCE_PROMPT_CONFIG = "prompt_config"
 PROMPT_SOURCE_JIRA = "jira"
 PROMPT_SOURCE_CLI = "cli"
 
+# Any of these selects the prompt-config source; the required ones must all be set.
+PROMPT_CONFIG_FIELDS = (
+    "prompt_config_owner",
+    "prompt_config_repo",
+    "prompt_config_path",
+)
+REQUIRED_PROMPT_CONFIG_FIELDS = ("prompt_config_repo", "prompt_config_path")
+
 
 def _resolve_secrets(state: WorkflowState) -> None:
     """Resolve secret inputs into `state.change_agent_secrets`."""
@@ -37,7 +45,7 @@ def _resolve_secrets(state: WorkflowState) -> None:
 def _merge_context_roots(state: WorkflowState) -> None:
     """Merge context roots from env (so CLI + env both apply)."""
     state.context_roots = merge_context_roots(
-        state.context_roots, get_context_roots_from_env()
+        state.context_roots, list(get_context_roots_from_env())
     )
 
 
@@ -47,29 +55,30 @@ class PromptSource:
     label: str
 
 
+# The two sources without per-run details are shared instances.
+_PROMPT_CONFIG_SOURCE = PromptSource(PROMPT_SOURCE_PROMPT_CONFIG, "prompt config")
+_CLI_SOURCE = PromptSource(PROMPT_SOURCE_CLI, "cli")
+
+
 def _determine_prompt_source(state: WorkflowState) -> PromptSource:
-    has_prompt_config = bool(
-        state.prompt_config_owner
-        or state.prompt_config_repo
-        or state.prompt_config_path
-    )
-    has_jira_prompt = bool(state.jira_ticket)
-    if has_prompt_config and has_jira_prompt:
+    has_prompt_config = any(getattr(state, f) for f in PROMPT_CONFIG_FIELDS)
+    ticket = state.jira_ticket
+    if has_prompt_config and ticket:
         raise ValueError("Choose only one prompt source: prompt config or Jira ticket.")
 
     if has_prompt_config:
-        return PromptSource(PROMPT_SOURCE_PROMPT_CONFIG, "prompt config")
-    if has_jira_prompt:
-        ticket = state.jira_ticket or ""
+        return _PROMPT_CONFIG_SOURCE
+    if ticket:
         return PromptSource(PROMPT_SOURCE_JIRA, f"jira ticket {ticket}")
-    return PromptSource(PROMPT_SOURCE_CLI, "cli")
+    return _CLI_SOURCE
 
 
 def _load_prompt_from_prompt_config(state: WorkflowState) -> None:
-    if not (state.prompt_config_repo and state.prompt_config_path):
+    missing = [f for f in REQUIRED_PROMPT_CONFIG_FIELDS if not getattr(state, f)]
+    if missing:
         raise ValueError(
             "When using prompt config, provide prompt_config_repo and prompt_config_path "
-            "(and prompt_config_owner or PROMPT_CONFIG_OWNER)"
+            f"(and prompt_config_owner or PROMPT_CONFIG_OWNER); missing: {', '.join(missing)}"
         )
 
     token = os.environ.get("GITHUB_TOKEN")
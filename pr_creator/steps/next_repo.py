@@ -7,7 +7,7 @@ class NextRepo(BaseNode):
     async def run(self, ctx: GraphRunContext) -> BaseNode | End:
         if not ctx.state.repos:
             return End(None)
-        repo_url = ctx.state.repos.pop(0)
+        repo_url = ctx.state.repos.popleft()
         from .naming import GenerateNames
 
         return GenerateNames(repo_url=repo_url)
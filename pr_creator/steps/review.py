@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
 
@@ -13,8 +14,6 @@ from pr_creator.review_agents import (
 
 logger = logging.getLogger(__name__)
 
-_agent: ReviewAgent = get_review_agent()
-
 
 def _snippet(text: str | None, *, limit: int = 300) -> str:
     s = (text or "").strip()
@@ -33,15 +32,17 @@ class ReviewChanges(BaseNode):
 
     async def run(self, ctx: GraphRunContext) -> BaseNode | End:
         path = ctx.state.cloned[self.repo_url]
+        agent: ReviewAgent = get_review_agent()
         logger.info("Reviewing changes for %s at %s", self.repo_url, path)
         logger.info(
             "[review] agent=%s max_attempts=%s current_attempts=%s",
-            type(_agent).__name__,
+            type(agent).__name__,
             _max_review_attempts(),
             ctx.state.review_attempts.get(self.repo_url, 0),
         )
 
-        needs_changes, feedback = _agent.review(
+        needs_changes, feedback = await asyncio.to_thread(
+            agent.review,
             path,
             context_roots=ctx.state.context_roots,
             task_prompt=ctx.state.prompt,
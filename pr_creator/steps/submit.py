@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
 
@@ -9,8 +10,6 @@ from pydantic_graph import BaseNode, End, GraphRunContext
 
 logger = logging.getLogger(__name__)
 
-_submitter = get_submitter()
-
 
 @dataclass
 class SubmitChanges(BaseNode):
@@ -19,7 +18,8 @@ class SubmitChanges(BaseNode):
     async def run(self, ctx: GraphRunContext) -> BaseNode | End:
         path = ctx.state.cloned[self.repo_url]
         logger.info("Submitting changes for %s at %s", self.repo_url, path)
-        result = _submitter.submit(
+        result = await asyncio.to_thread(
+            get_submitter().submit,
             path,
             change_prompt=ctx.state.prompt,
             change_id=ctx.state.change_id,
@@ -29,6 +29,7 @@ class SubmitChanges(BaseNode):
         )
         if result:
             ctx.state.created_prs.append(result)
+            ctx.state.latest_prs[self.repo_url] = result
         from .wait_for_actions import WaitForActions
 
         return WaitForActions(repo_url=self.repo_url)
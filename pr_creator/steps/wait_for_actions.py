@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 from dataclasses import dataclass
@@ -18,20 +19,7 @@ def _max_ci_attempts() -> int:
         return 2
 
 
-def _last_pr_url_for_repo(ctx: GraphRunContext, repo_url: str) -> str | None:
-    for pr in reversed(ctx.state.created_prs):
-        if pr.get("repo_url") == repo_url:
-            return pr.get("pr_url")
-    return None
-
-
-def _last_pr_record_for_repo(
-    ctx: GraphRunContext, repo_url: str
-) -> dict[str, str] | None:
-    for pr in reversed(ctx.state.created_prs):
-        if pr.get("repo_url") == repo_url:
-            return pr
-    return None
+_SUMMARY_SLOTS = ("- head_sha", "- summary", "- status")
 
 
 def _summarize_ci_message(message: str) -> str:
@@ -39,12 +27,23 @@ def _summarize_ci_message(message: str) -> str:
     CI failure messages can include large logs. This produces a small summary
     suitable for logging.
     """
-    lines = [ln.strip() for ln in (message or "").splitlines() if ln.strip()]
-    head_sha = next((ln for ln in lines if ln.startswith("- head_sha:")), None)
-    summary = next((ln for ln in lines if ln.startswith("- summary:")), None)
-    status = next((ln for ln in lines if ln.startswith("- status:")), None)
-    parts = [p for p in (head_sha, summary, status) if p]
-    return " ".join(parts) if parts else (lines[0] if lines else "CI failure")
+    # First line for each field, in output order; the scan stops once all are found.
+    found: dict[str, str] = {}
+    first_line = None
+    for raw in (message or "").splitlines():
+        ln = raw.strip()
+        if not ln:
+            continue
+        if first_line is None:
+            first_line = ln
+        if ln.startswith("- "):
+            prefix, sep, _ = ln.partition(":")
+            if sep and prefix in _SUMMARY_SLOTS and prefix not in found:
+                found[prefix] = ln
+                if len(found) == len(_SUMMARY_SLOTS):
+                    break
+    parts = [found[p] for p in _SUMMARY_SLOTS if p in found]
+    return " ".join(parts) if parts else (first_line or "CI failure")
 
 
 @dataclass
@@ -52,7 +51,7 @@ class WaitForActions(BaseNode):
     repo_url: str
 
     async def run(self, ctx: GraphRunContext) -> BaseNode | End:
-        pr_record = _last_pr_record_for_repo(ctx, self.repo_url)
+        pr_record = ctx.state.latest_prs.get(self.repo_url)
         pr_url = (pr_record or {}).get("pr_url")
         if not pr_url:
             logger.info("[ci] no PR url for %s; skipping wait", self.repo_url)
@@ -77,8 +76,12 @@ class WaitForActions(BaseNode):
         )
 
         expected_head_sha = (pr_record or {}).get("pushed_sha")
-        ok, message = wait_for_ci(
-            pr_url, token=token, cfg=cfg, expected_head_sha=expected_head_sha
+        ok, message = await asyncio.to_thread(
+            wait_for_ci,
+            pr_url,
+            token=token,
+            cfg=cfg,
+            expected_head_sha=expected_head_sha,
         )
         if ok:
             logger.info("[ci] %s", message)
@@ -89,11 +92,11 @@ class WaitForActions(BaseNode):
         attempts = ctx.state.ci_attempts.get(self.repo_url, 0)
         max_attempts = _max_ci_attempts()
         logger.warning(
-            "[ci] failure (attempt %s/%s) %s (details stored for agent; bytes=%s)",
+            "[ci] failure (attempt %s/%s) %s (details stored for agent; chars=%s)",
             attempts,
             max_attempts,
             _summarize_ci_message(message),
-            len(message.encode("utf-8", errors="ignore")),
+            len(message),
         )
 
         if attempts < max_attempts:
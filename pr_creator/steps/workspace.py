@@ -1,22 +1,34 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+import re
+import shutil
+import threading
 import uuid
 from dataclasses import dataclass
-import io
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Dict, Iterator, List, Optional, Set
 
 from dulwich import porcelain
+from dulwich.client import get_transport_and_path
+from dulwich.graph import can_fast_forward
+from dulwich.refs import SYMREF
 from dulwich.repo import Repo
-from github import Auth, Github
+from github import Github
 from pydantic_graph import BaseNode, End, GraphRunContext
 
 from pr_creator.git_urls import github_slug_from_url, token_auth_github_url
+from pr_creator.github_client import get_github, get_repo
 
 logger = logging.getLogger(__name__)
 
+# 0 clones full history; CLONE_DEPTH opts in to shallow clones.
+DEFAULT_CLONE_DEPTH = 0
+# Depth git sends for `fetch --unshallow`.
+_UNSHALLOW_DEPTH = 0x7FFFFFFF
+
 
 @dataclass(frozen=True)
 class CloneResult:
@@ -29,6 +41,44 @@ def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+_BRANCHES_WITH_PREFIX_QUERY = """
+query($owner: String!, $name: String!, $prefix: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    refs(
+      refPrefix: $prefix
+      first: 100
+      after: $cursor
+      orderBy: {field: ALPHABETICAL, direction: ASC}
+    ) {
+      nodes { name }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+
+def _iter_branches_with_prefix(gh: Github, slug: str, prefix: str) -> Iterator[str]:
+    """Yield branch names starting with `prefix`, filtered server-side via GraphQL."""
+    owner, name = slug.split("/", 1)
+    variables = {
+        "owner": owner,
+        "name": name,
+        "prefix": f"refs/heads/{prefix}",
+        "cursor": None,
+    }
+    while True:
+        _, data = gh.requester.graphql_query(_BRANCHES_WITH_PREFIX_QUERY, variables)
+        refs = data["data"]["repository"]["refs"]
+        for node in refs["nodes"]:
+            # Names are relative to refPrefix.
+            yield prefix + node["name"]
+        page = refs["pageInfo"]
+        if not page["hasNextPage"]:
+            return
+        variables["cursor"] = page["endCursor"]
+
+
 def _find_branch_with_change_prefix(
     repo_url: str,
     token: Optional[str],
@@ -41,14 +91,9 @@ def _find_branch_with_change_prefix(
         slug = github_slug_from_url(repo_url)
         if not slug:
             return None
-        gh = Github(auth=Auth.Token(token))
-        repo = gh.get_repo(slug)
         prefix = f"{change_id}/"
         first_match: Optional[str] = None
-        for branch in repo.get_branches():
-            name = branch.name
-            if not name.startswith(prefix):
-                continue
+        for name in _iter_branches_with_prefix(get_github(token), slug, prefix):
             if preferred and name == preferred:
                 logger.info(
                     "Found branch %s matching change id prefix %s", name, prefix
@@ -68,32 +113,98 @@ def _find_branch_with_change_prefix(
         return None
 
 
+_HEADS_PREFIX = b"refs/heads/"
+
+
+def _list_remote_heads(clone_url: str, prefixes: List[str]) -> Optional[Set[str]]:
+    """
+    Branch names under `prefixes`, read straight from the git server. Protocol v2
+    `ls-refs` filters by prefix server-side, so this is one round-trip that costs
+    no GitHub API quota. Returns None when the server cannot be queried.
+    """
+    wanted = tuple(_HEADS_PREFIX + prefix.encode() for prefix in prefixes)
+    try:
+        client, path = get_transport_and_path(clone_url)
+        result = client.get_refs(path, ref_prefix=list(wanted))
+    except Exception as exc:
+        logger.info("Could not list remote branches via git: %s", exc)
+        return None
+    # Older protocol versions ignore ref_prefix, so filter here as well.
+    return {
+        ref[len(_HEADS_PREFIX) :].decode()
+        for ref in result.refs
+        if ref.startswith(wanted)
+    }
+
+
+def _choose_branch(
+    heads: Set[str], branch_name: Optional[str], change_id: Optional[str]
+) -> Optional[str]:
+    if change_id:
+        prefix = f"{change_id}/"
+        matches = sorted(name for name in heads if name.startswith(prefix))
+        if matches:
+            name = branch_name if branch_name in matches else matches[0]
+            logger.info("Found branch %s matching change id prefix %s", name, prefix)
+            return name
+    if branch_name and branch_name in heads:
+        logger.info("Found existing branch %s", branch_name)
+        return branch_name
+    if branch_name:
+        logger.info("Branch %s does not exist yet", branch_name)
+    return None
+
+
 def _get_branch_to_checkout(
     repo_url: str,
+    clone_url: str,
     token: Optional[str],
     branch_name: Optional[str],
     change_id: Optional[str],
 ) -> Optional[str]:
+    prefixes = [f"{change_id}/"] if change_id else []
+    if branch_name:
+        prefixes.append(branch_name)
+    if prefixes:
+        heads = _list_remote_heads(clone_url, prefixes)
+        if heads is not None:
+            return _choose_branch(heads, branch_name, change_id)
+
+    # Fall back to the GitHub API when the git server could not be queried.
+    # Naming produces "<change_id>/<slug>", which the prefix scan would prefer
+    # anyway, so a hit on the cheap exact lookup makes the scan unnecessary.
+    exact_first = branch_name and (
+        not change_id or branch_name.startswith(f"{change_id}/")
+    )
+    if exact_first and _branch_exists_via_api(repo_url, token, branch_name):
+        return branch_name
+
     branch_from_prefix = _find_branch_with_change_prefix(
         repo_url, token, change_id, branch_name
     )
     if branch_from_prefix:
         return branch_from_prefix
 
-    if not branch_name or not token:
-        return None
+    if branch_name and not exact_first:
+        if _branch_exists_via_api(repo_url, token, branch_name):
+            return branch_name
+    return None
+
+
+def _branch_exists_via_api(repo_url: str, token: Optional[str], branch: str) -> bool:
+    if not token:
+        return False
     try:
         slug = github_slug_from_url(repo_url)
         if not slug:
-            return None
-        gh = Github(auth=Auth.Token(token))
-        repo = gh.get_repo(slug)
-        repo.get_branch(branch_name)
-        logger.info("Found existing branch %s", branch_name)
-        return branch_name
+            return False
+        # A bare ref lookup; get_branch also resolves the commit and protection info.
+        get_repo(token, slug).get_git_ref(f"heads/{branch}")
+        logger.info("Found existing branch %s", branch)
+        return True
     except Exception:
-        logger.info("Branch %s does not exist yet", branch_name)
-        return None
+        logger.info("Branch %s does not exist yet", branch)
+        return False
 
 
 def _get_clone_url(repo_url: str) -> str:
@@ -105,105 +216,223 @@ def _get_clone_url(repo_url: str) -> str:
     return repo_url
 
 
+# A run of anything other than alphanumerics and "_" (hyphens included) collapses
+# to a single hyphen.
+_UNSAFE_CHANGE_ID_RUN = re.compile(r"\W+")
+
+
+# Ids that sanitizing would leave unchanged: word characters and single hyphens,
+# starting and ending with an alphanumeric.
+_SAFE_CHANGE_ID = re.compile(r"[^\W_](?:(?:\w|-(?!-))*[^\W_])?")
+
+
 def _sanitize_change_id(change_id: str) -> str:
-    safe = "".join(c if c.isalnum() or c in ("-", "_") else "-" for c in change_id)
-    while "--" in safe:
-        safe = safe.replace("--", "-")
-    return safe.strip("-_") or "change"
+    if _SAFE_CHANGE_ID.fullmatch(change_id):
+        return change_id
+    return _UNSAFE_CHANGE_ID_RUN.sub("-", change_id).strip("-_") or "change"
 
 
 def _get_target_path(
     repo_url: str, working_dir: Path, change_id: Optional[str]
 ) -> Path:
     ensure_dir(working_dir)
-    name = repo_url.rstrip("/").split("/")[-1].removesuffix(".git")
-    if change_id:
-        safe_id = _sanitize_change_id(change_id)
-        return working_dir / f"{name}-{safe_id}"
-    return working_dir / f"{name}-{uuid.uuid4().hex[:8]}"
-
-
-def _get_default_branch(repo_url: str, token: Optional[str]) -> str:
+    rest, _, name = repo_url.rstrip("/").removesuffix(".git").rpartition("/")
+    # The owner keeps same-named repos (org1/api, org2/api) in separate workspaces.
+    # Sanitized owners never contain "--", so the directory name stays unambiguous.
+    owner = rest.rpartition("/")[2].rpartition(":")[2]
+    prefix = f"{_sanitize_change_id(owner)}--" if owner else ""
+    suffix = _sanitize_change_id(change_id) if change_id else uuid.uuid4().hex[:8]
+    return working_dir / f"{prefix}{name}-{suffix}"
+
+
+_ORIGIN_PREFIX = b"refs/remotes/origin/"
+_ORIGIN_HEAD = b"refs/remotes/origin/HEAD"
+
+
+def _get_default_branch(
+    repo_url: str, token: Optional[str], repo: Optional[Repo] = None
+) -> str:
+    # Clone and fetch record origin/HEAD, which saves a GitHub API round-trip.
+    if repo is not None:
+        target = repo.refs.get_symrefs().get(_ORIGIN_HEAD)
+        if target and target.startswith(_ORIGIN_PREFIX):
+            return target[len(_ORIGIN_PREFIX) :].decode()
     try:
         slug = github_slug_from_url(repo_url)
         if slug and token:
-            gh = Github(auth=Auth.Token(token))
-            repo = gh.get_repo(slug)
-            return repo.default_branch
+            return get_repo(token, slug).default_branch
     except Exception:
         pass
     return "main"
 
 
+def _clone_depth() -> Optional[int]:
+    """
+    History depth for new clones, or None for full history (the default). A positive
+    `CLONE_DEPTH` makes the first clone shallow; reused workspaces are unshallowed on
+    their next fetch.
+    """
+    raw = (os.environ.get("CLONE_DEPTH") or "").strip()
+    depth = DEFAULT_CLONE_DEPTH
+    if raw:
+        try:
+            depth = int(raw)
+        except Exception:
+            logger.warning("Invalid CLONE_DEPTH=%r; defaulting to full history", raw)
+    return depth if depth > 0 else None
+
+
+def _remove_in_background(path: Path) -> None:
+    # Non-daemon, so interpreter exit waits for the delete instead of killing it.
+    threading.Thread(
+        target=shutil.rmtree,
+        args=(path,),
+        kwargs={"ignore_errors": True},
+        name=f"rm-{path.name}",
+    ).start()
+
+
+def _move_aside(target: Path) -> None:
+    """
+    Rename an unusable workspace out of the way (O(1)) so the clone can start at once,
+    and delete the renamed tree on a background thread.
+    """
+    aside = target.with_name(f".{target.name}.stale-{uuid.uuid4().hex[:8]}")
+    try:
+        target.rename(aside)
+    except OSError as exc:
+        logger.warning("Could not move %s aside; removing it inline: %s", target, exc)
+        shutil.rmtree(target, ignore_errors=True)
+        return
+    _remove_in_background(aside)
+
+
+def _sweep_stale(target: Path) -> None:
+    """Delete trees `_move_aside` left behind for `target` in an earlier, killed run."""
+    for stale in target.parent.glob(f".{target.name}.stale-*"):
+        logger.info("Removing leftover workspace %s", stale)
+        _remove_in_background(stale)
+
+
 def load_or_clone_repo(target: Path, repo_url: str, clone_url: str) -> Repo:
     if target.exists() and (target / ".git").exists():
         logger.info("Reusing existing workspace at %s", target)
         try:
-            return Repo.discover(str(target))
+            return Repo(str(target))
         except Exception as exc:
             logger.warning(
                 "Existing workspace at %s is invalid; recloning: %s", target, exc
             )
+            _move_aside(target)
     else:
         if target.exists():
             logger.info(
                 "Not reusing existing path %s because .git is missing (likely not a repo)",
                 target,
             )
+            _move_aside(target)
         else:
             logger.info("No existing workspace at %s; will clone", target)
-    logger.info("Cloning %s -> %s", repo_url, target)
-    porcelain.clone(clone_url, target, checkout=True)
-    return Repo.discover(str(target))
+    depth = _clone_depth()
+    logger.info(
+        "Cloning %s -> %s (depth=%s)", repo_url, target, depth or "full history"
+    )
+    return porcelain.clone(clone_url, target, checkout=True, depth=depth)
 
 
 def _is_ancestor(repo: Repo, possible_ancestor: bytes, commit_sha: bytes) -> bool:
     """Return True if possible_ancestor is reachable from commit_sha (inclusive)."""
-    if possible_ancestor == commit_sha:
-        return True
-    stack = [commit_sha]
-    seen: set[bytes] = set()
-    while stack:
-        sha = stack.pop()
-        if sha in seen:
-            continue
-        seen.add(sha)
+    try:
+        # Date-ordered merge-base walk; stops once it passes possible_ancestor
+        # instead of visiting all of commit_sha's history.
+        return can_fast_forward(repo, possible_ancestor, commit_sha)
+    except Exception:
+        return False
+
+
+def _write_tracking_refs(repo: Repo, tracking_refs: Dict[bytes, bytes]) -> int:
+    try:
+        # One packed-refs rewrite instead of a locked loose-ref file per branch.
+        repo.refs.add_packed_refs(tracking_refs)
+        return len(tracking_refs)
+    except Exception:
+        pass
+    written = 0
+    for tracking, sha in tracking_refs.items():
         try:
-            obj = repo[sha]
+            repo.refs[tracking] = sha
+            written += 1
         except Exception:
-            continue
-        parents = getattr(obj, "parents", None)
-        if not parents:
-            continue
-        for p in parents:
-            if p == possible_ancestor:
-                return True
-            stack.append(p)
-    return False
-
-
-def fetch_refs(repo: Repo, clone_url: str, repo_url: str) -> Dict[bytes, bytes]:
+            # Best-effort: lack of tracking refs should not break workspaces.
+            pass
+    return written
+
+
+def fetch_refs(
+    repo: Repo, clone_url: str, repo_url: str, branch: Optional[str]
+) -> Dict[bytes, bytes]:
+    """
+    Fetch only `branch` and the remote HEAD (the default branch) rather than every
+    head on the remote. Returns the remote refs that were fetched.
+
+    A shallow workspace is unshallowed: dulwich does not download new tips into a
+    shallow repo without a depth, and comparing tips needs their shared history.
+    """
+    wanted = {b"HEAD"}
+    depth = _UNSHALLOW_DEPTH if repo.get_shallow() else None
+    if branch:
+        wanted.add(_HEADS_PREFIX + branch.encode())
+
+    def determine_wants(refs, depth=None):
+        return repo.object_store.determine_wants_all(
+            {ref: sha for ref, sha in refs.items() if ref in wanted}, depth
+        )
+
     try:
-        # Silence noisy fetch output, but keep warnings/errors in logs.
-        out = io.StringIO()
-        err = io.BytesIO()
-        remote_refs: Dict[bytes, bytes] = porcelain.fetch(
-            repo.path, clone_url, outstream=out, errstream=err
+        client, path = get_transport_and_path(clone_url)
+        # ref_prefix lets a protocol v2 server advertise just these refs. Progress
+        # output is dropped; failures still surface as exceptions.
+        result = client.fetch(
+            path,
+            repo,
+            determine_wants=determine_wants,
+            progress=lambda _data: None,
+            depth=depth,
+            ref_prefix=sorted(wanted),
         )
+        # Never point a tracking ref at an object the fetch did not download.
+        object_store = repo.object_store
+        remote_refs: Dict[bytes, bytes] = {
+            ref: sha
+            for ref, sha in result.refs.items()
+            if ref in wanted and sha and sha in object_store
+        }
+        if len(remote_refs) < len(wanted & result.refs.keys()):
+            logger.warning(
+                "Fetch for %s did not download every wanted ref; keeping their old "
+                "tracking refs",
+                repo_url,
+            )
 
-        # dulwich returns refs, but it doesn't always populate remote-tracking refs under
+        # A fetch by URL does not populate remote-tracking refs under
         # refs/remotes/origin/*. Write them so downstream logic can reliably find them.
-        written = 0
-        for ref_name, sha in remote_refs.items():
-            if not ref_name.startswith(b"refs/heads/"):
-                continue
-            branch_name = ref_name[len(b"refs/heads/") :]
-            tracking = b"refs/remotes/origin/" + branch_name
+        tracking_refs = {
+            _ORIGIN_PREFIX + ref_name[len(_HEADS_PREFIX) :]: sha
+            for ref_name, sha in remote_refs.items()
+            if ref_name.startswith(_HEADS_PREFIX)
+        }
+        head = result.symrefs.get(b"HEAD", b"")
+        if head.startswith(_HEADS_PREFIX) and b"HEAD" in remote_refs:
+            tracking_refs[_ORIGIN_PREFIX + head[len(_HEADS_PREFIX) :]] = remote_refs[
+                b"HEAD"
+            ]
+        written = _write_tracking_refs(repo, tracking_refs)
+        if head.startswith(_HEADS_PREFIX):
             try:
-                repo.refs[tracking] = sha
-                written += 1
+                repo.refs.set_symbolic_ref(
+                    _ORIGIN_HEAD, _ORIGIN_PREFIX + head[len(_HEADS_PREFIX) :]
+                )
             except Exception:
-                # Best-effort: lack of tracking refs should not break workspaces.
                 pass
         if written:
             logger.info(
@@ -235,6 +464,16 @@ def ensure_branch_from_remote(
         f"@{remote_sha.hex()[:8]}" if remote_sha else "",
     )
 
+    # Rerun of an unchanged workspace: HEAD is already on the branch and the branch
+    # matches origin, so there is nothing to check out.
+    if (
+        local_exists
+        and local_sha == remote_sha
+        and repo.refs.read_ref(b"HEAD") == SYMREF + branch_ref
+    ):
+        logger.info("Workspace already at %s (matches origin)", branch)
+        return
+
     # Prefer keeping an existing local branch (don't throw away history on reruns).
     if local_exists:
         repo.refs.set_symbolic_ref(b"HEAD", branch_ref)
@@ -276,7 +515,7 @@ def ensure_branch_from_remote(
         return
 
     if not remote_exists:
-        default_branch = _get_default_branch(repo_url, token)
+        default_branch = _get_default_branch(repo_url, token, repo)
         logger.warning(
             "Remote branch %s not found and no local branch exists; falling back to %s",
             branch,
@@ -302,11 +541,12 @@ def ensure_branch_from_remote(
 def create_branch_from_default(
     repo: Repo, new_branch: str, repo_url: str, token: Optional[str]
 ) -> None:
-    default_branch = _get_default_branch(repo_url, token)
     head_ref = repo.refs.read_ref(b"HEAD")
-    base_ref = (
-        head_ref if head_ref in repo.refs else f"refs/heads/{default_branch}".encode()
-    )
+    if head_ref in repo.refs:
+        base_ref = head_ref
+    else:
+        default_branch = _get_default_branch(repo_url, token, repo)
+        base_ref = f"refs/heads/{default_branch}".encode()
     branch_ref = f"refs/heads/{new_branch}".encode()
     if branch_ref not in repo.refs:
         logger.info("Creating feature branch %s from %s", new_branch, base_ref.decode())
@@ -328,15 +568,20 @@ def prepare_workspace(
     if not branch_name:
         raise RuntimeError("Branch name must be provided by naming step before clone.")
     target = _get_target_path(repo_url, working_dir, change_id)
+    _sweep_stale(target)
     clone_url = _get_clone_url(repo_url)
     token = os.environ.get("GITHUB_TOKEN")
     branch_to_checkout = _get_branch_to_checkout(
-        repo_url, token, branch_name, change_id
+        repo_url, clone_url, token, branch_name, change_id
     )
     branch_exists_remotely = branch_to_checkout is not None
 
+    reusing = (target / ".git").exists()
     repo = load_or_clone_repo(target, repo_url, clone_url)
-    fetch_refs(repo, clone_url, repo_url)
+    # A fresh clone already has every origin/* ref; only reused workspaces need
+    # a fetch to catch up.
+    if reusing:
+        fetch_refs(repo, clone_url, repo_url, branch_to_checkout)
 
     if branch_to_checkout:
         ensure_branch_from_remote(repo, branch_to_checkout, repo_url, token)
@@ -356,8 +601,12 @@ class WorkspaceRepo(BaseNode):
 
     async def run(self, ctx: GraphRunContext) -> BaseNode | End:
         branch_name = ctx.state.branches.get(self.repo_url)
-        result = prepare_workspace(
-            self.repo_url, ctx.state.working_dir, ctx.state.change_id, branch_name
+        result = await asyncio.to_thread(
+            prepare_workspace,
+            self.repo_url,
+            ctx.state.working_dir,
+            ctx.state.change_id,
+            branch_name,
         )
         ctx.state.cloned[self.repo_url] = result.path
         ctx.state.branches[self.repo_url] = result.branch
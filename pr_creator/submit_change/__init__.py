@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 
 from .base import SubmitChange
 from .github_submitter import GithubSubmitter
@@ -8,13 +9,18 @@ from .github_submitter import GithubSubmitter
 DEFAULT_SUBMITTER = "github"
 
 
+@lru_cache(maxsize=None)
+def _get_submitter_cached(submitter_name: str) -> SubmitChange:
+    if submitter_name == "github":
+        return GithubSubmitter()
+    raise ValueError(f"Unknown submitter: {submitter_name}")
+
+
 def get_submitter(name: str | None = None) -> SubmitChange:
     submitter_name = (
         name or os.environ.get("SUBMIT_CHANGE") or DEFAULT_SUBMITTER
     ).lower()
-    if submitter_name == "github":
-        return GithubSubmitter()
-    raise ValueError(f"Unknown submitter: {submitter_name}")
+    return _get_submitter_cached(submitter_name)
 
 
 __all__ = ["SubmitChange", "GithubSubmitter", "get_submitter"]
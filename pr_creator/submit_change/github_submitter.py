@@ -3,17 +3,20 @@ from __future__ import annotations
 import io
 import logging
 import os
+from heapq import heappop, heappush
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
 from dulwich import porcelain
 from dulwich.config import StackedConfig
+from dulwich.objects import Commit
+from dulwich.refs import SYMREF
 from dulwich.repo import Repo
-from github import Auth, Github
 from github.GithubException import GithubException
 from github.Repository import Repository
 
 from .base import SubmitChange
+from pr_creator.github_client import get_repo
 from pr_creator.git_urls import (
     github_slug_from_url,
     strip_auth_from_url,
@@ -24,28 +27,32 @@ logger = logging.getLogger(__name__)
 
 
 def _load_repo(repo_path: Path) -> Repo:
-    return Repo.discover(str(repo_path))
+    return Repo(str(repo_path))
 
 
-def _origin_url(repo: Repo) -> str:
-    cfg: StackedConfig = repo.get_config()
+def _origin_url(cfg: StackedConfig) -> str:
     url_bytes = cfg.get((b"remote", b"origin"), b"url")
     return url_bytes.decode()
 
 
+_HEADS_PREFIX = b"refs/heads/"
+_ORIGIN_PREFIX = b"refs/remotes/origin/"
+_BRANCH_SYMREF = SYMREF + _HEADS_PREFIX
+
+
 def _current_branch(repo: Repo) -> str:
     """Get the current branch (assumes HEAD points to the desired branch)."""
-    head = repo.refs.read_ref(b"HEAD")
-    if head and head.startswith(b"refs/heads/"):
-        return head[len(b"refs/heads/") :].decode()
-    # Fallback: pick a branch whose ref matches HEAD target, or any branch
-    head_sha = repo.refs.read_ref(b"HEAD")
-    for ref_name in repo.refs.keys():
-        if ref_name.startswith(b"refs/heads/") and repo.refs[ref_name] == head_sha:
-            return ref_name[len(b"refs/heads/") :].decode()
-    for ref_name in repo.refs.keys():
-        if ref_name.startswith(b"refs/heads/"):
-            return ref_name[len(b"refs/heads/") :].decode()
+    # read_ref returns the raw HEAD contents: "ref: refs/heads/<name>" or a SHA.
+    head = repo.refs.read_ref(b"HEAD") or b""
+    if head.startswith(_BRANCH_SYMREF):
+        return head[len(_BRANCH_SYMREF) :].decode()
+    # Detached HEAD: pick a branch at the HEAD commit, or any branch
+    branches = repo.refs.as_dict(b"refs/heads")
+    for name, sha in branches.items():
+        if sha == head:
+            return name.decode()
+    for name in branches:
+        return name.decode()
     raise RuntimeError("HEAD is not pointing to a branch; clone step should set it")
 
 
@@ -61,8 +68,7 @@ def _config_value(
     return str(value)
 
 
-def _ensure_identity(repo: Repo) -> tuple[str, str]:
-    cfg = repo.get_config()
+def _ensure_identity(cfg: StackedConfig) -> tuple[str, str]:
     name = os.environ.get("GIT_AUTHOR_NAME") or _config_value(cfg, (b"user",), b"name")
     email = os.environ.get("GIT_AUTHOR_EMAIL") or _config_value(
         cfg, (b"user",), b"email"
@@ -71,28 +77,23 @@ def _ensure_identity(repo: Repo) -> tuple[str, str]:
     return author, author
 
 
-def _git_status_dirty(repo: Repo) -> bool:
-    status = porcelain.status(repo)
-    return bool(status.staged or status.unstaged or status.untracked)
-
-
 def _index_has_changes_vs_head(repo: Repo) -> bool:
     """Return True if the index differs from HEAD (i.e., there is something to commit)."""
     head_commit = repo[repo.head()]
-    head_tree = head_commit.tree
-    index = repo.open_index()
-    return any(index.changes_from_tree(repo.object_store, head_tree))
+    # Writing the index as a tree and comparing ids skips the entry-by-entry diff
+    # against HEAD; the tree objects are the ones a following commit would write.
+    return repo.open_index().commit(repo.object_store) != head_commit.tree
 
 
-def _commit_changes_if_needed(repo: Repo, message: str) -> bool:
-    author, committer = _ensure_identity(repo)
+def _commit_changes_if_needed(repo: Repo, message: str, cfg: StackedConfig) -> bool:
     porcelain.add(repo.path)
 
     # Be strict: only commit when the staged/index state actually differs from HEAD.
-    # This avoids empty/no-op commits in cases where `status()` can be misleading.
+    # This avoids empty/no-op commits.
     if not _index_has_changes_vs_head(repo):
         return False
 
+    author, committer = _ensure_identity(cfg)
     porcelain.commit(
         repo.path,
         message=message,
@@ -104,7 +105,7 @@ def _commit_changes_if_needed(repo: Repo, message: str) -> bool:
 
 
 def _remote_tracking_ref(branch: str) -> bytes:
-    return f"refs/remotes/origin/{branch}".encode()
+    return _ORIGIN_PREFIX + branch.encode()
 
 
 def _ahead_behind_vs_origin(repo: Repo, branch: str) -> tuple[int, int]:
@@ -112,8 +113,9 @@ def _ahead_behind_vs_origin(repo: Repo, branch: str) -> tuple[int, int]:
     Return (ahead, behind) commit counts for local HEAD vs origin/<branch>, using the
     locally-fetched remote tracking ref.
 
-    If there is no origin tracking ref, treat it as (ahead=1, behind=0) so we attempt
-    to push the local branch to origin.
+    If there is no origin tracking ref, or the history needed to compare against it
+    is missing locally, treat it as (ahead=1, behind=0) so we attempt to push the
+    local branch to origin; a push that is not a fast-forward is rejected there.
     """
     local = repo.head()
     remote_ref = _remote_tracking_ref(branch)
@@ -124,23 +126,116 @@ def _ahead_behind_vs_origin(repo: Repo, branch: str) -> tuple[int, int]:
     if remote is None:
         return 1, 0
 
-    ahead = sum(
-        1
-        for _ in repo.get_walker(
-            include=[local],
-            exclude=[remote],
+    counts = _count_ahead_behind(repo, local, remote)
+    if counts is None:
+        logger.warning(
+            "[submit] history for origin/%s is incomplete locally; "
+            "cannot compare, will attempt push",
+            branch,
         )
-    )
-    behind = sum(
-        1
-        for _ in repo.get_walker(
-            include=[remote],
-            exclude=[local],
-        )
-    )
+        return 1, 0
+    return counts
+
+
+_LOCAL = 1
+_REMOTE = 2
+_BOTH = _LOCAL | _REMOTE
+# Commits to keep walking once the walk looks finished, to absorb commit-time skew
+# (rebases, cherry-picks, bad clocks). Mirrors git's SLOP in revision.c.
+_SLOP = 5
+
+
+def _count_ahead_behind(
+    repo: Repo, local: bytes, remote: bytes
+) -> Optional[tuple[int, int]]:
+    """
+    Count commits reachable only from `local` (ahead) and only from `remote` (behind)
+    in one newest-first walk, like `git rev-list --left-right --count`.
+
+    Each commit is tagged with the side(s) that reach it. The walk may stop once
+    every pending commit is reached from both sides and is older than every commit
+    reached from one side only; it then walks `_SLOP` more commits in case commit
+    times go backwards, restarting the count whenever that no longer holds.
+
+    Shallow boundaries end the walk like root commits (via the parents provider).
+    Returns None when a commit the walk needs is not in the object store.
+    """
+    if local == remote:
+        return 0, 0
+    parents = repo.parents_provider()
+    flags: Dict[bytes, int] = {local: _LOCAL, remote: _REMOTE}
+    # Each commit is read from the object store once.
+    commits: Dict[bytes, Commit] = {}
+    queue: list[tuple[int, bytes, bool]] = []
+    oldest_one_sided = None
+    one_sided_pending = 0
+
+    def enqueue(sha: bytes) -> None:
+        nonlocal oldest_one_sided, one_sided_pending
+        commit = commits.get(sha) or commits.setdefault(sha, object_store[sha])
+        one_sided = flags[sha] != _BOTH
+        heappush(queue, (-commit.commit_time, sha, one_sided))
+        if one_sided:
+            one_sided_pending += 1
+            if oldest_one_sided is None or commit.commit_time < oldest_one_sided:
+                oldest_one_sided = commit.commit_time
+
+    object_store = repo.object_store
+    try:
+        enqueue(local)
+        enqueue(remote)
+        slop = _SLOP
+        while queue:
+            if one_sided_pending or -queue[0][0] >= oldest_one_sided:
+                slop = _SLOP
+            else:
+                slop -= 1
+                if not slop:
+                    break
+            _, sha, one_sided = heappop(queue)
+            one_sided_pending -= one_sided
+            side = flags[sha]
+            for parent in parents.get_parents(sha, commit=commits[sha]):
+                seen = flags.get(parent, 0)
+                if seen | side != seen:
+                    flags[parent] = seen | side
+                    enqueue(parent)
+    except KeyError:
+        return None
+    ahead = sum(1 for side in flags.values() if side == _LOCAL)
+    behind = sum(1 for side in flags.values() if side == _REMOTE)
     return ahead, behind
 
 
+class _NullStream(io.RawIOBase):
+    """Write-only sink that discards push progress instead of buffering it."""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        return len(data)
+
+
+class _TailStream(_NullStream):
+    """Sink that keeps only the last `limit` bytes, for reporting a failed push."""
+
+    def __init__(self, limit: int = 4096) -> None:
+        super().__init__()
+        self._limit = limit
+        self._tail = bytearray()
+
+    def write(self, data) -> int:
+        self._tail += data
+        # Trim in batches so each write does not shift the whole buffer.
+        if len(self._tail) > 2 * self._limit:
+            del self._tail[: -self._limit]
+        return len(data)
+
+    def text(self) -> str:
+        return bytes(self._tail[-self._limit :]).decode("utf-8", "replace").strip()
+
+
 def _push_branch(repo: Repo, branch: str, token: str, origin_url: str) -> None:
     """Push branch to remote."""
     push_url = token_auth_github_url(origin_url, token)
@@ -148,16 +243,26 @@ def _push_branch(repo: Repo, branch: str, token: str, origin_url: str) -> None:
         raise RuntimeError(f"Unsupported origin URL for token push: {origin_url}")
 
     refspec = f"refs/heads/{branch}:refs/heads/{branch}"
-    # Avoid logging tokens; log a sanitized URL and silence push output streams.
+    # Avoid logging tokens; log a sanitized URL and silence push output streams,
+    # keeping the tail of the remote's messages in case the push fails.
     logger.info("[submit] pushing %s to origin", refspec)
-    null_stream = io.BytesIO()
-    porcelain.push(
-        repo.path,
-        push_url,
-        refspecs=[refspec],
-        errstream=null_stream,
-        outstream=null_stream,
-    )
+    err_tail = _TailStream()
+    try:
+        porcelain.push(
+            repo.path,
+            push_url,
+            refspecs=[refspec],
+            errstream=err_tail,
+            outstream=_NullStream(),
+        )
+    except Exception:
+        if err_tail.text():
+            logger.error(
+                "[submit] push of %s failed; remote output: %s",
+                refspec,
+                err_tail.text(),
+            )
+        raise
 
 
 def _build_pr_body(base_body: str, change_prompt: Optional[str]) -> str:
@@ -174,12 +279,11 @@ def _get_remote_repo_and_base_branch(
     if not github_token:
         return None, base_branch or "main"
 
-    gh = Github(auth=Auth.Token(github_token))
     slug = github_slug_from_url(origin)
     if not slug:
         return None, base_branch or "main"
 
-    remote_repo = gh.get_repo(slug)
+    remote_repo = get_repo(github_token, slug)
     if base_branch is None:
         base_branch = remote_repo.default_branch
 
@@ -191,22 +295,20 @@ def _find_existing_pr(
 ):
     """Return an existing PR for the given branch/base combination if present."""
     head = f"{remote_repo.owner.login}:{branch}"
-    states = ["open", "closed"] if include_closed else ["open"]
-
-    for state in states:
-        try:
-            pulls = remote_repo.get_pulls(state=state, head=head, base=base_branch)
-            for pr in pulls:
-                return pr
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.warning(
-                "[submit] failed to list %s PRs for head=%s base=%s: %s",
-                state,
-                head,
-                base_branch,
-                exc,
-            )
-            return None
+    # One listing covers both states; only the first page is ever fetched.
+    state = "all" if include_closed else "open"
+    try:
+        pulls = remote_repo.get_pulls(state=state, head=head, base=base_branch)
+        for pr in pulls:
+            return pr
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning(
+            "[submit] failed to list %s PRs for head=%s base=%s: %s",
+            state,
+            head,
+            base_branch,
+            exc,
+        )
     return None
 
 
@@ -252,13 +354,18 @@ class GithubSubmitter(SubmitChange):
         commit_message: str | None = None,
     ) -> Optional[Dict[str, str]]:
         repo = _load_repo(Path(repo_path))
-        origin = strip_auth_from_url(_origin_url(repo))
+        # Parsed once; both the origin URL and the commit identity come from it.
+        config = repo.get_config()
+        origin = strip_auth_from_url(_origin_url(config))
         pushed_sha: str | None = None
 
         # Ensure we are on the intended branch (change agents may checkout base)
         if branch:
-            desired_ref = f"refs/heads/{branch}".encode()
-            if desired_ref in repo.refs:
+            desired_ref = _HEADS_PREFIX + branch.encode()
+            if repo.refs.read_ref(b"HEAD") == SYMREF + desired_ref:
+                # Already on the branch; a checkout would only re-read the tree.
+                logger.info("[submit] already on branch %s", branch)
+            elif desired_ref in repo.refs:
                 repo.refs.set_symbolic_ref(b"HEAD", desired_ref)
                 porcelain.checkout_branch(repo, branch, force=True)
             else:
@@ -311,55 +418,9 @@ class GithubSubmitter(SubmitChange):
             _push_branch(repo, current_branch, self.github_token, origin)
             return True
 
-        # Commit only when there is something to commit.
-        # Note: `status()` is a cheap pre-check, but we still double-check after staging.
-        if not _git_status_dirty(repo):
-            logger.info("[submit] no local file changes detected")
-            pushed = _push_if_ahead()
-            if not pushed:
-                logger.info("[submit] nothing to push; skipping PR creation")
-                return None
-
-            # We pushed commits, so we should return an existing PR if one exists.
-            if not remote_repo:
-                logger.warning("GITHUB_TOKEN not set; skipping PR creation")
-                return {"repo_url": origin, "branch": current_branch, "pr_url": None}
-
-            if current_branch == base_branch:
-                logger.warning(
-                    "Current branch '%s' matches base '%s'; skipping PR creation",
-                    current_branch,
-                    base_branch,
-                )
-                return {"repo_url": origin, "branch": current_branch, "pr_url": None}
-
-            existing = _return_existing_pr_if_any(
-                remote_repo, origin, current_branch, base_branch
-            )
-            if existing:
-                if pushed_sha:
-                    existing["pushed_sha"] = pushed_sha
-                return existing
-
-            logger.info(
-                "[submit] creating PR head=%s base=%s", current_branch, base_branch
-            )
-            pr = remote_repo.create_pull(
-                title=pr_title_final,
-                body=pr_body,
-                head=current_branch,
-                base=base_branch,
-            )
-            result = {
-                "repo_url": origin,
-                "branch": current_branch,
-                "pr_url": pr.html_url,
-            }
-            if pushed_sha:
-                result["pushed_sha"] = pushed_sha
-            return result
-
-        committed = _commit_changes_if_needed(repo, commit_message_final)
+        # Stage everything and commit only when the index differs from HEAD. Staging
+        # already walks the working tree, so there is no separate status() check.
+        committed = _commit_changes_if_needed(repo, commit_message_final, config)
         pushed = False
         if not committed:
             logger.info(
@@ -380,7 +441,6 @@ class GithubSubmitter(SubmitChange):
             return {"repo_url": origin, "branch": current_branch, "pr_url": None}
 
         if pushed and committed:
-            pushed_sha = pushed_sha or repo.head().hex()
             _push_branch(repo, current_branch, self.github_token, origin)
 
         if not remote_repo:
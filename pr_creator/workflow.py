@@ -7,6 +7,7 @@ from .steps import (
     CleanupRepo,
     DiscoverRepos,
     EvaluateRelevance,
+    FanOutRepos,
     GenerateNames,
     InitWorkflow,
     NextRepo,
@@ -24,6 +25,7 @@ def build_graph() -> Graph:
         nodes=[
             InitWorkflow,
             DiscoverRepos,
+            FanOutRepos,
             NextRepo,
             GenerateNames,
             WorkspaceRepo,
@@ -1,10 +1,25 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from pathlib import Path
+
 WORKSPACE_ROOT = "/workspace"
 REPO_DIR = f"{WORKSPACE_ROOT}/repo"
+# Parent of all cloned repos, used when one container serves several repos.
+REPOS_DIR = f"{WORKSPACE_ROOT}/repos"
 CONTEXT_DIR = f"{WORKSPACE_ROOT}/context"
 
 
+@lru_cache(maxsize=256)
+def resolve_host_path(path: str) -> str:
+    """
+    Absolute, symlink-free host path for mounting/hinting.
+
+    Cached because every agent run for a repo resolves the same path again.
+    """
+    return str(Path(path).expanduser().resolve())
+
+
 def workspace_prompt_prefix(
     *, include_repo_hint: bool, repo_dir: str | None, context_dirs: list[str]
 ) -> str:
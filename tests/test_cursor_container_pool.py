@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import os
+import socket
+from types import SimpleNamespace
+
+import pytest
+
+from pr_creator.cursor_utils.runners import docker_runner
+from pr_creator.cursor_utils.runners.docker_runner import (
+    POOL_LABEL,
+    CursorContainerPool,
+    DockerCursorRunner,
+)
+
+
+class _Container:
+    def __init__(self, name: str, labels: dict[str, str]) -> None:
+        self.id = self.name = name
+        self.labels = labels
+        self.state = "running"
+
+    def remove(self, force: bool = False) -> None:
+        self.state = "removed"
+
+    def kill(self) -> None:
+        self.state = "exited"
+
+    def exec_run(self, command, **kwargs):
+        raise KeyboardInterrupt
+
+
+class _Containers:
+    def __init__(self, stale: list[_Container] | None = None) -> None:
+        self.started: list[_Container] = []
+        self.stale = stale or []
+
+    def run(self, image, *, name, labels, **kwargs) -> _Container:
+        container = _Container(name, labels)
+        self.started.append(container)
+        return container
+
+    def list(self, filters):
+        return [c for c in self.stale if filters["label"] in c.labels]
+
+
+@pytest.fixture
+def pool(monkeypatch: pytest.MonkeyPatch) -> CursorContainerPool:
+    monkeypatch.setattr(docker_runner.atexit, "register", lambda fn: None)
+    return CursorContainerPool(max_idle=1)
+
+
+def test_shutdown_retires_checked_out_containers(pool: CursorContainerPool) -> None:
+    client = SimpleNamespace(containers=_Containers())
+    pool.acquire(client, "image", {"/a": {"bind": "/x", "mode": "rw"}})
+    kept_key, kept = pool.acquire(client, "image", {}, remove=False)
+    pool.release(kept_key, kept)
+
+    pool.shutdown()
+
+    busy, kept = client.containers.started
+    assert busy.state == "removed"
+    assert kept.state == "exited"
+    assert busy.labels[POOL_LABEL] == f"{socket.gethostname()}:{os.getpid()}"
+
+
+def test_interrupted_exec_discards_container(pool: CursorContainerPool) -> None:
+    client = SimpleNamespace(containers=_Containers())
+    runner = DockerCursorRunner(pool_size=1)
+    runner._pool = pool
+
+    with pytest.raises(KeyboardInterrupt):
+        runner._exec_in_pool(
+            client,
+            "image",
+            ["cursor-agent"],
+            volumes={},
+            workdir="/workspace",
+            env_vars={},
+            stream=False,
+            remove=True,
+        )
+
+    assert [c.state for c in client.containers.started] == ["removed"]
+    pool.shutdown()
+
+
+def test_first_start_reaps_containers_of_dead_processes(
+    pool: CursorContainerPool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    host = socket.gethostname()
+    dead = _Container("dead", {POOL_LABEL: f"{host}:111"})
+    alive = _Container("alive", {POOL_LABEL: f"{host}:{os.getpid()}"})
+    remote = _Container("remote", {POOL_LABEL: "elsewhere:111"})
+    client = SimpleNamespace(containers=_Containers([dead, alive, remote]))
+    monkeypatch.setattr(docker_runner, "_process_alive", lambda pid: pid != 111)
+
+    pool.acquire(client, "image", {})
+
+    assert [c.state for c in (dead, alive, remote)] == [
+        "removed",
+        "running",
+        "running",
+    ]
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from pr_creator.cursor_utils.streaming import iter_line_batches, stream_cursor_output
+
+
+def _event(text: str) -> bytes:
+    # Serialise like Node's JSON.stringify: U+2028/U+2029/\x85 stay unescaped.
+    event = {
+        "type": "assistant",
+        "message": {"role": "assistant", "content": [{"type": "text", "text": text}]},
+    }
+    return (json.dumps(event, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+@pytest.mark.parametrize("separator", ["\u2028", "\u2029", "\x85"])
+def test_stream_keeps_events_with_unicode_line_separators(
+    separator: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    data = _event(f"Answer:{separator}yes") + _event(" done")
+
+    # Split mid-character as well as mid-event to exercise the incremental decoder.
+    chunks = [data[i : i + 7] for i in range(0, len(data), 7)]
+    output = stream_cursor_output(chunks, env={})
+
+    assert output == f"Answer:{separator}yes done"
+    assert capsys.readouterr().out == output
+
+
+def test_iter_line_batches_splits_on_newline_only() -> None:
+    chunks = [b"a\xe2\x80", b"\xa8b\nc\xc2\x85d\r\ne", b"f"]
+
+    assert list(iter_line_batches(chunks)) == [["a\u2028b\n", "c\x85d\r\n"], ["ef"]]
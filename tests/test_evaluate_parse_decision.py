@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import pytest
+
+from pr_creator.evaluate_agents.cursor_agent import _parse_decision
+
+
+@pytest.mark.parametrize(
+    ("output", "expected"),
+    [
+        ("Reasoning mentions no issues.\n\n**Yes**", True),
+        ("It says yes somewhere, but the answer is **no**.", False),
+        ("Looked around. Final answer: no.", False),
+        ("No obvious match at first, " + "filler " * 20 + "but overall: yes", True),
+        ("No, " + "word " * 50, False),
+        ("x" * 5000 + " ayes", False),
+        ("nothing decisive here", False),
+    ],
+)
+def test_parse_decision(output: str, expected: bool) -> None:
+    assert _parse_decision(output) is expected
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import pr_creator.workflow as workflow
+from pr_creator.steps.fan_out import FanOutRepos
+
+
+def test_failed_lane_cancels_its_siblings(monkeypatch: pytest.MonkeyPatch) -> None:
+    events: list[str] = []
+    lane_ids = iter(range(3))
+
+    async def run(start, *, state):
+        lane = next(lane_ids)
+        if lane == 0:
+            await asyncio.sleep(0)
+            raise RuntimeError("lane failed")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            events.append(f"cancelled {lane}")
+            raise
+        events.append(f"finished {lane}")
+
+    monkeypatch.setenv("MAX_CONCURRENT_REPOS", "3")
+    monkeypatch.setattr(workflow, "build_graph", lambda: SimpleNamespace(run=run))
+    ctx = SimpleNamespace(state=SimpleNamespace(repos=["a", "b", "c"]))
+
+    async def main() -> None:
+        with pytest.raises(RuntimeError, match="lane failed"):
+            await FanOutRepos().run(ctx)
+        # Siblings were awaited, not left running in the background.
+        assert sorted(events) == ["cancelled 1", "cancelled 2"]
+
+    asyncio.run(main())
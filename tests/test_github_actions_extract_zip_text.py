@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import io
+import zipfile
+
+from pr_creator.github_actions import _extract_zip_text
+
+
+def _zip(files: dict[str, str]) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, content in files.items():
+            zf.writestr(name, content)
+    return buf.getvalue()
+
+
+def test_extract_zip_text_orders_entries_and_skips_blank_files() -> None:
+    data = _zip(
+        {"2_test.txt": "tests failed\n", "1_build.txt": "built ok\n", "empty.txt": " "}
+    )
+
+    assert _extract_zip_text(data, max_chars=1000) == (
+        "--- 1_build.txt ---\nbuilt ok\n\n--- 2_test.txt ---\ntests failed"
+    )
+
+
+def test_extract_zip_text_truncates_large_entries() -> None:
+    data = _zip({"a.txt": "x" * 100_000, "b.txt": "never read"})
+
+    result = _extract_zip_text(data, max_chars=50)
+
+    assert result.startswith("--- a.txt ---\nxxx")
+    assert result.endswith("\n... (truncated)")
+    assert "b.txt" not in result
+    assert len(result) == 50 + len("\n... (truncated)")
+
+
+def test_extract_zip_text_falls_back_to_plain_text() -> None:
+    assert _extract_zip_text(b"plain log output", max_chars=5) == "plain"
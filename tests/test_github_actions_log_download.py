@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pytest
+
+import pr_creator.github_actions as github_actions
+
+
+def _fake_request(calls: list[dict]):
+    def _request(url, *, token, extra_headers=None, max_bytes=None, **kwargs):
+        calls.append({"url": url, "headers": extra_headers, "max_bytes": max_bytes})
+        if token:
+            return 302, {"Location": "https://logs.example.com/archive"}, b""
+        return 206, {}, b"zip-bytes"
+
+    return _request
+
+
+@pytest.mark.parametrize(
+    ("max_bytes", "headers", "read_limit"),
+    [
+        (1000, {"Range": "bytes=0-999"}, 1000),
+        (0, None, None),
+    ],
+)
+def test_redirected_log_download_range(
+    monkeypatch: pytest.MonkeyPatch, max_bytes: int, headers, read_limit
+) -> None:
+    calls: list[dict] = []
+    monkeypatch.setattr(github_actions, "_request", _fake_request(calls))
+
+    data = github_actions._get_bytes_follow_redirect(
+        "https://api.github.com/logs", token="t", max_bytes=max_bytes
+    )
+
+    assert data == b"zip-bytes"
+    assert calls[1] == {
+        "url": "https://logs.example.com/archive",
+        "headers": headers,
+        "max_bytes": read_limit,
+    }
+
+
+@pytest.mark.parametrize("raw", ["0", "-5"])
+def test_load_ci_wait_config_rejects_non_positive_log_bytes(
+    monkeypatch: pytest.MonkeyPatch, raw: str
+) -> None:
+    monkeypatch.setenv("CI_MAX_LOG_BYTES", raw)
+
+    assert github_actions.load_ci_wait_config().max_log_bytes == 5_000_000
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+from dulwich.objects import Commit, Tree
+from dulwich.repo import Repo
+
+from pr_creator.submit_change.github_submitter import (
+    _ahead_behind_vs_origin,
+    _count_ahead_behind,
+)
+
+
+class _History:
+    def __init__(self, repo_dir: Path) -> None:
+        self.repo = Repo.init(str(repo_dir), mkdir=not repo_dir.exists())
+        self.tree = Tree()
+        self.repo.object_store.add_object(self.tree)
+        self.count = 0
+
+    def commit(self, commit_time: int, *parents: bytes) -> bytes:
+        commit = Commit()
+        commit.tree = self.tree.id
+        commit.parents = list(parents)
+        commit.author = commit.committer = b"tester <tester@example.com>"
+        commit.author_time = commit.commit_time = commit_time
+        commit.author_timezone = commit.commit_timezone = 0
+        # Unique messages keep otherwise identical commits distinct.
+        self.count += 1
+        commit.message = b"commit %d" % self.count
+        self.repo.object_store.add_object(commit)
+        return commit.id
+
+
+def _expected(repo: Repo, local: bytes, remote: bytes) -> tuple[int, int]:
+    def ancestors(sha: bytes) -> set[bytes]:
+        seen: set[bytes] = set()
+        stack = [sha]
+        while stack:
+            current = stack.pop()
+            if current not in seen:
+                seen.add(current)
+                stack.extend(repo[current].parents)
+        return seen
+
+    local_side, remote_side = ancestors(local), ancestors(remote)
+    return len(local_side - remote_side), len(remote_side - local_side)
+
+
+def test_count_ahead_behind_with_clock_skew(tmp_path: Path) -> None:
+    history = _History(tmp_path)
+    base = history.commit(1000)
+    # The remote side was rebased with an old clock: its commits look older than
+    # the shared base, so a walk that trusts commit times stops too early.
+    remote = history.commit(10, history.commit(5, base))
+    shared = history.commit(2000, base)
+    local = history.commit(3000, history.commit(2500, shared), remote)
+
+    assert _count_ahead_behind(history.repo, local, remote) == (3, 0)
+    assert _count_ahead_behind(history.repo, remote, local) == (0, 3)
+
+
+def test_count_ahead_behind_with_merges(tmp_path: Path) -> None:
+    history = _History(tmp_path)
+    root = history.commit(100)
+    left = history.commit(200, root)
+    right = history.commit(200, root)
+    merge = history.commit(300, left, right)
+    local = history.commit(400, merge)
+    remote = history.commit(350, right)
+
+    assert _count_ahead_behind(history.repo, local, remote) == (3, 1)
+    assert _count_ahead_behind(history.repo, local, local) == (0, 0)
+
+
+@pytest.mark.parametrize("skew", [0, 1000, 100000])
+def test_count_ahead_behind_matches_ancestor_sets(tmp_path: Path, skew: int) -> None:
+    rng = random.Random(skew)
+    for attempt in range(50):
+        history = _History(tmp_path / str(attempt))
+        shas: list[bytes] = []
+        for i in range(40):
+            recent = shas[-15:]
+            parents = rng.sample(recent, min(len(recent), rng.choice((1, 1, 1, 2))))
+            shas.append(history.commit(i * 100 + rng.randint(-skew, skew), *parents))
+        local, remote = rng.sample(shas[20:], 2)
+
+        assert _count_ahead_behind(history.repo, local, remote) == _expected(
+            history.repo, local, remote
+        )
+
+
+def test_count_ahead_behind_with_missing_parent(tmp_path: Path) -> None:
+    history = _History(tmp_path)
+    # A tracking ref whose history was never fetched.
+    remote = history.commit(200, b"1" * 40)
+    local = history.commit(300, history.commit(100))
+
+    assert _count_ahead_behind(history.repo, local, remote) is None
+    assert _count_ahead_behind(history.repo, local, b"2" * 40) is None
+
+
+def test_count_ahead_behind_stops_at_shallow_boundary(tmp_path: Path) -> None:
+    history = _History(tmp_path)
+    # The boundary's own parent was never fetched.
+    boundary = history.commit(100, b"1" * 40)
+    history.repo.update_shallow([boundary], [])
+    local = history.commit(300, history.commit(200, boundary))
+    remote = history.commit(250, boundary)
+
+    assert _count_ahead_behind(history.repo, local, remote) == (2, 1)
+
+
+def test_ahead_behind_vs_origin_pushes_when_history_is_missing(
+    tmp_path: Path,
+) -> None:
+    history = _History(tmp_path)
+    local = history.commit(100)
+    history.repo.refs[b"refs/heads/feature"] = local
+    history.repo.refs.set_symbolic_ref(b"HEAD", b"refs/heads/feature")
+    history.repo.refs[b"refs/remotes/origin/feature"] = history.commit(200, b"1" * 40)
+
+    assert _ahead_behind_vs_origin(history.repo, "feature") == (1, 0)
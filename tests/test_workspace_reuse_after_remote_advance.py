@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import shutil
+import socket
+import subprocess
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Iterator
+
+import pytest
+from dulwich import porcelain
+from dulwich.repo import Repo
+
+import pr_creator.submit_change.github_submitter as github_submitter
+from pr_creator.steps.workspace import prepare_workspace
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="needs git")
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def remote(tmp_path: Path) -> Iterator[tuple[str, Path]]:
+    """Serve a bare repo over git:// (shallow fetches need a real upload-pack)."""
+    served = tmp_path / "served"
+    _git(tmp_path, "init", "-q", "--bare", "-b", "main", str(served / "acme.git"))
+    pusher = tmp_path / "pusher"
+    _git(tmp_path, "clone", "-q", str(served / "acme.git"), str(pusher))
+    _git(pusher, "config", "user.email", "tester@example.com")
+    _git(pusher, "config", "user.name", "tester")
+    for message in ("one", "two"):
+        (pusher / "README.md").write_text(f"{message}\n", encoding="utf-8")
+        _git(pusher, "add", "README.md")
+        _git(pusher, "commit", "-q", "-m", message)
+    _git(pusher, "push", "-q", "origin", "HEAD:main", "HEAD:feature")
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    daemon = subprocess.Popen(
+        [
+            "git",
+            "daemon",
+            "--reuseaddr",
+            "--export-all",
+            "--listen=127.0.0.1",
+            f"--port={port}",
+            f"--base-path={served}",
+            str(served),
+        ],
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"git://127.0.0.1:{port}/acme.git"
+    try:
+        for _ in range(50):
+            if subprocess.run(["git", "ls-remote", url], capture_output=True).stdout:
+                break
+            time.sleep(0.1)
+        yield url, pusher
+    finally:
+        daemon.terminate()
+        daemon.wait()
+
+
+@pytest.mark.parametrize("clone_depth", ["", "1"])
+def test_reused_workspace_picks_up_advanced_remote_and_submits(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    remote: tuple[str, Path],
+    clone_depth: str,
+) -> None:
+    url, pusher = remote
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    monkeypatch.setenv("CLONE_DEPTH", clone_depth)
+    working_dir = tmp_path / "work"
+    prepare_workspace(url, working_dir, "c1", "feature")
+
+    _git(pusher, "commit", "-q", "--allow-empty", "-m", "advance")
+    _git(pusher, "push", "-q", "origin", "HEAD:feature")
+    advanced = _git(pusher, "rev-parse", "HEAD").encode()
+
+    result = prepare_workspace(url, working_dir, "c1", "feature")
+    repo = Repo(str(result.path))
+    assert repo.refs[b"refs/heads/feature"] == advanced
+    assert repo.refs[b"refs/remotes/origin/feature"] == advanced
+
+    # A change agent commits on the branch, leaving a clean tree.
+    (result.path / "README.md").write_text("changed\n", encoding="utf-8")
+    porcelain.add(str(result.path))
+    porcelain.commit(
+        str(result.path),
+        message=b"change",
+        author=b"tester <tester@example.com>",
+        committer=b"tester <tester@example.com>",
+        sign=False,
+    )
+
+    monkeypatch.setenv("GITHUB_TOKEN", "dummy")
+    monkeypatch.setattr(
+        github_submitter,
+        "_get_remote_repo_and_base_branch",
+        lambda origin, github_token, base_branch: (SimpleNamespace(), "main"),
+    )
+    push_calls: list[str] = []
+    monkeypatch.setattr(
+        github_submitter,
+        "_push_branch",
+        lambda repo_obj, branch, token, origin_url: push_calls.append(branch),
+    )
+    monkeypatch.setattr(
+        github_submitter,
+        "_return_existing_pr_if_any",
+        lambda remote_repo, origin, branch, base_branch, include_closed=False: {
+            "pr_url": "https://example.com/pull/1"
+        },
+    )
+
+    submitted = github_submitter.GithubSubmitter().submit(result.path, branch="feature")
+
+    assert push_calls == ["feature"]
+    assert submitted["pushed_sha"] == repo.head().hex()
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pr_creator.steps.workspace import _get_target_path
+
+
+@pytest.mark.parametrize(
+    ("repo_url", "expected"),
+    [
+        ("https://github.com/org1/api.git", "org1--api-feat-x"),
+        ("https://github.com/org2/api/", "org2--api-feat-x"),
+        ("git@github.com:org2/api.git", "org2--api-feat-x"),
+        ("api", "api-feat-x"),
+    ],
+)
+def test_target_path_includes_owner(
+    tmp_path: Path, repo_url: str, expected: str
+) -> None:
+    assert _get_target_path(repo_url, tmp_path, "feat/x") == tmp_path / expected
+
+
+def test_same_named_repos_get_separate_workspaces(tmp_path: Path) -> None:
+    first = _get_target_path("https://github.com/org1/api", tmp_path, "c1")
+    second = _get_target_path("https://github.com/org2/api", tmp_path, "c1")
+
+    assert first != second